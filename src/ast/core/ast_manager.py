@@ -56,9 +56,8 @@ class ASTManager:
                     parse_time_ms=0,
                 )
 
-            # Read file content
-            with open(file_path_obj, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Read file content off the event loop so batch reads overlap
+            content = await asyncio.to_thread(file_path_obj.read_text, encoding="utf-8")
 
             # Detect language
             language = self.detector.detect_from_content(content)
@@ -185,43 +184,51 @@ class ASTManager:
             "cache_hit_ratio": "N/A",  # Would need tracking
         }
 
+    def _extracted(self, result: ASTResult, kind: str) -> Optional[List[Any]]:
+        """
+        Get extracted entities of a kind from a parse result
+
+        Uses the lists filled in during parsing, and only re-walks ast_root
+        for parsers that leave them unset.
+        """
+        if not result.success:
+            return None
+
+        entities = getattr(result, kind)
+        if entities is not None:
+            return entities
+
+        parser = self.parsers.get(result.language)
+        if not parser or not result.ast_root:
+            return None
+
+        return getattr(parser, f"extract_{kind}")(result.ast_root)
+
     async def extract_functions_from_file(self, file_path: str) -> List[str]:
         """Extract function names from a file"""
         result = await self.parse_file(file_path)
-        if not result.success or not result.ast_root:
-            return []
-
-        parser = self.parsers.get(result.language)
-        if not parser:
+        functions = self._extracted(result, "functions")
+        if functions is None:
             return []
 
-        functions = parser.extract_functions(result.ast_root)
         return [func.name for func in functions]
 
     async def extract_classes_from_file(self, file_path: str) -> List[str]:
         """Extract class names from a file"""
         result = await self.parse_file(file_path)
-        if not result.success or not result.ast_root:
+        classes = self._extracted(result, "classes")
+        if classes is None:
             return []
 
-        parser = self.parsers.get(result.language)
-        if not parser:
-            return []
-
-        classes = parser.extract_classes(result.ast_root)
         return [cls.name for cls in classes]
 
     async def extract_imports_from_file(self, file_path: str) -> List[str]:
         """Extract import statements from a file"""
         result = await self.parse_file(file_path)
-        if not result.success or not result.ast_root:
-            return []
-
-        parser = self.parsers.get(result.language)
-        if not parser:
+        imports = self._extracted(result, "imports")
+        if imports is None:
             return []
 
-        imports = parser.extract_imports(result.ast_root)
         return [
             f"{imp.module}.{imp.name}" if imp.name else imp.module for imp in imports
         ]
@@ -229,14 +236,10 @@ class ASTManager:
     async def get_dependencies_for_file(self, file_path: str) -> Dict[str, List[str]]:
         """Get dependency mapping for a file"""
         result = await self.parse_file(file_path)
-        if not result.success or not result.ast_root:
-            return {}
-
-        parser = self.parsers.get(result.language)
-        if not parser:
+        imports = self._extracted(result, "imports")
+        if imports is None:
             return {}
 
-        imports = parser.extract_imports(result.ast_root)
         dependencies = {}
 
         for imp in imports:
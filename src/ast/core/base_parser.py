@@ -40,7 +40,7 @@ class ASTResult:
     parse_time_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     """Function parameter representation"""
 
@@ -51,7 +51,7 @@ class Parameter:
     docstring: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Function:
     """Function definition representation"""
 
@@ -67,7 +67,7 @@ class Function:
     class_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     """Class property/attribute representation"""
 
@@ -80,7 +80,7 @@ class Property:
     is_property: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Method:
     """Class method representation"""
 
@@ -96,7 +96,7 @@ class Method:
     complexity_score: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Class:
     """Class definition representation"""
 
@@ -111,7 +111,7 @@ class Class:
     access_level: str = "public"
 
 
-@dataclass
+@dataclass(slots=True)
 class Import:
     """Import statement representation"""
 
@@ -124,7 +124,7 @@ class Import:
     is_standard_library: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable:
     """Variable definition representation"""
 
@@ -0,0 +1,698 @@
+use syn::spanned::Spanned;
+use syn::{Attribute, Item, ItemConst, ItemEnum, ItemFn, ItemImpl, ItemStatic, ItemStruct, ItemTrait, ItemUse};
+use proc_macro2::{Delimiter, Group, TokenStream, TokenTree};
+use quote::{quote, ToTokens};
+use std::env;
+use std::fs;
+use std::io::{self, Read, Write};
+use std::str::FromStr;
+
+#[derive(serde::Deserialize)]
+struct BatchSource {
+    path: String,
+    content: String,
+}
+
+// Outcome for one file of a --batch run; exactly one of `ast` and `error` is set
+#[derive(serde::Serialize)]
+struct BatchResult<'a> {
+    path: &'a str,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    ast: Option<AstResult>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    error: Option<String>,
+}
+
+#[derive(Debug, Default, serde::Serialize)]
+struct AstResult {
+    functions: Vec<FunctionInfo>,
+    structs: Vec<StructInfo>,
+    enums: Vec<EnumInfo>,
+    traits: Vec<TraitInfo>,
+    imports: Vec<ImportInfo>,
+    variables: Vec<VariableInfo>,
+    impl_blocks: Vec<ImplInfo>,
+    modules: Vec<String>,
+    macros: Vec<MacroInfo>,
+    unsafe_blocks: Vec<usize>,
+    lifetimes: Vec<String>,
+    crate_name: String,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct FunctionInfo {
+    name: String,
+    parameters: Vec<ParamInfo>,
+    return_type: String,
+    line: usize,
+    is_exported: bool,
+    is_unsafe: bool,
+    is_async: bool,
+    generics: Vec<String>,
+    lifetimes: Vec<String>,
+    where_clause: Option<String>,
+    doc: String,
+    attributes: Vec<String>,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct ParamInfo {
+    name: String,
+    type_name: String,
+    is_mut: bool,
+    is_reference: bool,
+    is_lifetime: bool,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct StructInfo {
+    name: String,
+    fields: Vec<FieldInfo>,
+    line: usize,
+    is_exported: bool,
+    generics: Vec<String>,
+    lifetimes: Vec<String>,
+    where_clause: Option<String>,
+    doc: String,
+    attributes: Vec<String>,
+    is_tuple: bool,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct FieldInfo {
+    name: String,
+    type_name: String,
+    is_pub: bool,
+    is_mut: bool,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct EnumInfo {
+    name: String,
+    variants: Vec<VariantInfo>,
+    line: usize,
+    is_exported: bool,
+    generics: Vec<String>,
+    lifetimes: Vec<String>,
+    where_clause: Option<String>,
+    doc: String,
+    attributes: Vec<String>,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct VariantInfo {
+    name: String,
+    fields: Vec<FieldInfo>,
+    is_tuple: bool,
+    is_unit: bool,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct TraitInfo {
+    name: String,
+    methods: Vec<FunctionInfo>,
+    line: usize,
+    is_exported: bool,
+    generics: Vec<String>,
+    lifetimes: Vec<String>,
+    where_clause: Option<String>,
+    supertraits: Vec<String>,
+    doc: String,
+    attributes: Vec<String>,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct ImportInfo {
+    path: String,
+    name: Option<String>,
+    alias: Option<String>,
+    line: usize,
+    is_glob: bool,
+    attributes: Vec<String>,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct VariableInfo {
+    name: String,
+    type_name: String,
+    value: Option<String>,
+    line: usize,
+    is_exported: bool,
+    is_const: bool,
+    is_static: bool,
+    doc: String,
+    attributes: Vec<String>,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct ImplInfo {
+    target_type: String,
+    trait_name: Option<String>,
+    methods: Vec<FunctionInfo>,
+    line: usize,
+    is_unsafe: bool,
+    generics: Vec<String>,
+    lifetimes: Vec<String>,
+    where_clause: Option<String>,
+}
+
+#[derive(Debug, serde::Serialize)]
+struct MacroInfo {
+    name: String,
+    content: String,
+    line: usize,
+    is_exported: bool,
+}
+
+fn main() {
+    let args: Vec<String> = env::args().collect();
+    if args.len() != 2 {
+        eprintln!("Usage: {} <filename> | --stdin | --batch | --daemon", args[0]);
+        std::process::exit(1);
+    }
+
+    if args[1] == "--daemon" {
+        if let Err(err) = run_daemon() {
+            eprintln!("Daemon failed: {}", err);
+            std::process::exit(1);
+        }
+        return;
+    }
+
+    if args[1] == "--batch" {
+        let sources: Vec<BatchSource> =
+            serde_json::from_reader(io::stdin().lock()).expect("Could not read batch");
+        let results: Vec<BatchResult> = sources
+            .iter()
+            .map(|source| {
+                let (ast, error) = match parse_source(&source.content) {
+                    Ok(ast) => (Some(ast), None),
+                    Err(err) => (None, Some(err)),
+                };
+                BatchResult { path: &source.path, ast, error }
+            })
+            .collect();
+        write_json(&results);
+        return;
+    }
+
+    let content = if args[1] == "--stdin" {
+        io::read_to_string(io::stdin()).expect("Could not read stdin")
+    } else {
+        fs::read_to_string(&args[1]).expect("Could not read file")
+    };
+
+    match parse_source(&content) {
+        Ok(result) => write_json(&result),
+        Err(err) => {
+            eprintln!("Unable to parse file: {}", err);
+            std::process::exit(1);
+        }
+    }
+}
+
+// Write compact JSON straight to stdout; the reader is a program, not a person
+fn write_json<T: serde::Serialize>(value: &T) {
+    let mut stdout = io::BufWriter::new(io::stdout().lock());
+    serde_json::to_writer(&mut stdout, value).unwrap();
+    stdout.flush().unwrap();
+}
+
+// Serve length-prefixed requests on stdin until it is closed: each request is a
+// little-endian u32 byte length followed by UTF-8 source, and each response is a
+// u32 length followed by the JSON result, or {"error": ...} if parsing failed.
+fn run_daemon() -> io::Result<()> {
+    let mut stdin = io::stdin().lock();
+    let mut stdout = io::stdout().lock();
+    let mut len_buf = [0u8; 4];
+
+    loop {
+        match stdin.read_exact(&mut len_buf) {
+            Ok(()) => {}
+            Err(err) if err.kind() == io::ErrorKind::UnexpectedEof => return Ok(()),
+            Err(err) => return Err(err),
+        }
+        let mut source = vec![0u8; u32::from_le_bytes(len_buf) as usize];
+        stdin.read_exact(&mut source)?;
+
+        let result = match String::from_utf8(source) {
+            Ok(content) => parse_source(&content),
+            Err(err) => Err(err.to_string()),
+        };
+        let payload = match result {
+            Ok(value) => serde_json::to_vec(&value),
+            Err(err) => serde_json::to_vec(&serde_json::json!({ "error": err })),
+        }
+        .unwrap();
+
+        stdout.write_all(&(payload.len() as u32).to_le_bytes())?;
+        stdout.write_all(&payload)?;
+        stdout.flush()?;
+    }
+}
+
+fn parse_source(content: &str) -> Result<AstResult, String> {
+    let result = extract_items(content);
+    // Drop span bookkeeping for this source so daemon and batch runs do not grow
+    proc_macro2::extra::invalidate_current_thread_spans();
+    result
+}
+
+// Replace every function body with an empty block, keeping its span. Nothing
+// reads statements, so syn then only parses signatures and item structure.
+// Macro input (the group after `!` or a `macro_rules!` name) and initializer
+// expressions after `=` are reported verbatim, so they are left untouched.
+fn strip_fn_bodies(tokens: TokenStream) -> TokenStream {
+    let mut after_fn = false;
+    let mut in_fn = false;
+    let mut in_macro = false;
+    let mut in_expr = false;
+    tokens
+        .into_iter()
+        .map(|token| {
+            // `fn name` starts a function; a bare `fn(...)` is a pointer type
+            in_fn |= after_fn && matches!(token, TokenTree::Ident(_));
+            after_fn = matches!(&token, TokenTree::Ident(ident) if ident == "fn");
+            match &token {
+                TokenTree::Punct(punct) if punct.as_char() == '!' => {
+                    in_macro = true;
+                    token
+                }
+                TokenTree::Punct(punct) if punct.as_char() == '=' && !in_fn => {
+                    in_expr = true;
+                    token
+                }
+                TokenTree::Punct(punct) if punct.as_char() == ';' => {
+                    in_fn = false;
+                    in_macro = false;
+                    in_expr = false;
+                    token
+                }
+                TokenTree::Group(group) if group.delimiter() == Delimiter::Brace && in_fn => {
+                    in_fn = false;
+                    in_macro = false;
+                    let mut body = Group::new(Delimiter::Brace, inner_attributes(group.stream()));
+                    body.set_span(group.span());
+                    TokenTree::Group(body)
+                }
+                TokenTree::Group(_) if in_macro || in_expr => {
+                    in_macro = false;
+                    token
+                }
+                TokenTree::Group(group) if group.delimiter() == Delimiter::Brace => {
+                    let mut body = Group::new(Delimiter::Brace, strip_fn_bodies(group.stream()));
+                    body.set_span(group.span());
+                    TokenTree::Group(body)
+                }
+                _ => token,
+            }
+        })
+        .collect()
+}
+
+// Keep the leading `#![...]` attributes of a body; syn reports them on the item
+fn inner_attributes(body: TokenStream) -> TokenStream {
+    let tokens: Vec<TokenTree> = body.into_iter().collect();
+    let mut end = 0;
+    while let [TokenTree::Punct(hash), TokenTree::Punct(bang), TokenTree::Group(group), ..] =
+        &tokens[end..]
+    {
+        if hash.as_char() != '#' || bang.as_char() != '!' || group.delimiter() != Delimiter::Bracket {
+            break;
+        }
+        end += 3;
+    }
+    tokens.into_iter().take(end).collect()
+}
+
+fn extract_items(mut content: &str) -> Result<AstResult, String> {
+    // Drop a BOM and shebang line the same way syn::parse_file does
+    content = content.strip_prefix('\u{feff}').unwrap_or(content);
+    if content.starts_with("#!") && !content[2..].trim_start().starts_with('[') {
+        content = content.find('\n').map_or("", |idx| &content[idx..]);
+    }
+
+    let tokens = TokenStream::from_str(content).map_err(|err| err.to_string())?;
+    let syntax: syn::File = syn::parse2(strip_fn_bodies(tokens)).map_err(|err| err.to_string())?;
+
+    let mut result = AstResult::default();
+
+    for item in syntax.items {
+        match item {
+            Item::Fn(item_fn) => result.functions.push(extract_function_info(&item_fn, content)),
+            Item::Struct(item_struct) => result.structs.push(extract_struct_info(&item_struct, content)),
+            Item::Enum(item_enum) => result.enums.push(extract_enum_info(&item_enum, content)),
+            Item::Trait(item_trait) => result.traits.push(extract_trait_info(&item_trait, content)),
+            Item::Use(item_use) => result.imports.push(extract_import_info(&item_use, content)),
+            Item::Const(item_const) => {
+                result.variables.push(extract_variable_info_const(&item_const, content))
+            }
+            Item::Static(item_static) => {
+                result.variables.push(extract_variable_info_static(&item_static, content))
+            }
+            Item::Impl(item_impl) => result.impl_blocks.push(extract_impl_info(&item_impl, content)),
+            Item::Mod(item_mod) => result.modules.push(item_mod.ident.to_string()),
+            Item::Macro(item_macro) => result.macros.push(extract_macro_info(&item_macro, content)),
+            _ => {}
+        }
+    }
+
+    Ok(result)
+}
+
+fn extract_function_info(item_fn: &ItemFn, src: &str) -> FunctionInfo {
+    extract_signature_info(
+        &item_fn.sig,
+        item_fn.span().start().line,
+        matches!(item_fn.vis, syn::Visibility::Public(_)),
+        &item_fn.attrs,
+        src,
+    )
+}
+
+// Shared by free functions, trait methods and impl methods, which differ only in
+// where the span, visibility and attributes come from
+fn extract_signature_info(
+    sig: &syn::Signature,
+    line: usize,
+    is_exported: bool,
+    attrs: &[Attribute],
+    src: &str,
+) -> FunctionInfo {
+    let mut parameters = Vec::new();
+    
+    for input in &sig.inputs {
+        if let syn::FnArg::Typed(pat_type) = input {
+            if let syn::Pat::Ident(pat_ident) = &*pat_type.pat {
+                let param_info = ParamInfo {
+                    name: pat_ident.ident.to_string(),
+                    type_name: source_text(&*pat_type.ty, src),
+                    is_mut: pat_ident.mutability.is_some(),
+                    is_reference: matches!(&*pat_type.ty, syn::Type::Reference(_)),
+                    is_lifetime: false,
+                };
+                parameters.push(param_info);
+            }
+        }
+    }
+
+    let (generics, lifetimes, where_clause) = extract_generics(&sig.generics, src);
+
+    FunctionInfo {
+        name: sig.ident.to_string(),
+        parameters,
+        return_type: match &sig.output {
+            syn::ReturnType::Default => "()".to_string(),
+            syn::ReturnType::Type(_, ty) => source_text(&**ty, src),
+        },
+        line,
+        is_exported,
+        is_unsafe: sig.unsafety.is_some(),
+        is_async: sig.asyncness.is_some(),
+        generics,
+        lifetimes,
+        where_clause,
+        doc: extract_doc(attrs),
+        attributes: extract_attributes(attrs, src),
+    }
+}
+
+// Split generic parameters into type/const names and lifetimes, plus the where clause
+fn extract_generics(generics: &syn::Generics, src: &str) -> (Vec<String>, Vec<String>, Option<String>) {
+    let mut names = Vec::new();
+    let mut lifetimes = Vec::new();
+
+    for param in &generics.params {
+        match param {
+            syn::GenericParam::Type(type_param) => {
+                names.push(type_param.ident.to_string());
+            }
+            syn::GenericParam::Lifetime(lifetime_def) => {
+                lifetimes.push(lifetime_def.lifetime.to_string());
+            }
+            syn::GenericParam::Const(const_param) => {
+                names.push(const_param.ident.to_string());
+            }
+        }
+    }
+
+    let where_clause = generics.where_clause.as_ref().map(|w| source_text(w, src));
+    (names, lifetimes, where_clause)
+}
+
+fn extract_fields(fields: &syn::Fields, src: &str) -> Vec<FieldInfo> {
+    match fields {
+        syn::Fields::Named(fields_named) => fields_named
+            .named
+            .iter()
+            .filter_map(|field| {
+                field.ident.as_ref().map(|ident| FieldInfo {
+                    name: ident.to_string(),
+                    type_name: source_text(&field.ty, src),
+                    is_pub: matches!(field.vis, syn::Visibility::Public(_)),
+                    is_mut: false,
+                })
+            })
+            .collect(),
+        syn::Fields::Unnamed(fields_unnamed) => fields_unnamed
+            .unnamed
+            .iter()
+            .enumerate()
+            .map(|(index, field)| FieldInfo {
+                name: format!("{}", index),
+                type_name: source_text(&field.ty, src),
+                is_pub: matches!(field.vis, syn::Visibility::Public(_)),
+                is_mut: false,
+            })
+            .collect(),
+        syn::Fields::Unit => Vec::new(),
+    }
+}
+
+fn extract_struct_info(item_struct: &ItemStruct, src: &str) -> StructInfo {
+    let (generics, lifetimes, where_clause) = extract_generics(&item_struct.generics, src);
+
+    StructInfo {
+        name: item_struct.ident.to_string(),
+        fields: extract_fields(&item_struct.fields, src),
+        line: item_struct.span().start().line,
+        is_exported: matches!(item_struct.vis, syn::Visibility::Public(_)),
+        generics,
+        lifetimes,
+        where_clause,
+        doc: extract_doc(&item_struct.attrs),
+        attributes: extract_attributes(&item_struct.attrs, src),
+        is_tuple: matches!(item_struct.fields, syn::Fields::Unnamed(_)),
+    }
+}
+
+fn extract_enum_info(item_enum: &ItemEnum, src: &str) -> EnumInfo {
+    let (generics, lifetimes, where_clause) = extract_generics(&item_enum.generics, src);
+
+    let variants = item_enum
+        .variants
+        .iter()
+        .map(|variant| VariantInfo {
+            name: variant.ident.to_string(),
+            fields: extract_fields(&variant.fields, src),
+            is_tuple: matches!(variant.fields, syn::Fields::Unnamed(_)),
+            is_unit: matches!(variant.fields, syn::Fields::Unit),
+        })
+        .collect();
+
+    EnumInfo {
+        name: item_enum.ident.to_string(),
+        variants,
+        line: item_enum.span().start().line,
+        is_exported: matches!(item_enum.vis, syn::Visibility::Public(_)),
+        generics,
+        lifetimes,
+        where_clause,
+        doc: extract_doc(&item_enum.attrs),
+        attributes: extract_attributes(&item_enum.attrs, src),
+    }
+}
+
+fn extract_trait_info(item_trait: &ItemTrait, src: &str) -> TraitInfo {
+    let (generics, lifetimes, where_clause) = extract_generics(&item_trait.generics, src);
+
+    let supertraits = item_trait
+        .supertraits
+        .iter()
+        .map(|bound| source_text(bound, src))
+        .collect();
+
+    let methods = item_trait
+        .items
+        .iter()
+        .filter_map(|item| match item {
+            // Trait methods are public by default
+            syn::TraitItem::Fn(method) => Some(extract_signature_info(
+                &method.sig,
+                method.span().start().line,
+                true,
+                &method.attrs,
+                src,
+            )),
+            _ => None,
+        })
+        .collect();
+
+    TraitInfo {
+        name: item_trait.ident.to_string(),
+        methods,
+        line: item_trait.span().start().line,
+        is_exported: matches!(item_trait.vis, syn::Visibility::Public(_)),
+        generics,
+        lifetimes,
+        where_clause,
+        supertraits,
+        doc: extract_doc(&item_trait.attrs),
+        attributes: extract_attributes(&item_trait.attrs, src),
+    }
+}
+
+fn extract_import_info(item_use: &ItemUse, src: &str) -> ImportInfo {
+    let path = source_text(&item_use.tree, src);
+    let is_glob = path.contains("*");
+
+    ImportInfo {
+        path,
+        name: None,
+        alias: None,
+        line: item_use.span().start().line,
+        is_glob,
+        attributes: extract_attributes(&item_use.attrs, src),
+    }
+}
+
+fn extract_variable_info_const(item_const: &ItemConst, src: &str) -> VariableInfo {
+    VariableInfo {
+        name: item_const.ident.to_string(),
+        type_name: source_text(&*item_const.ty, src),
+        value: Some(source_text(&*item_const.expr, src)),
+        line: item_const.span().start().line,
+        is_exported: matches!(item_const.vis, syn::Visibility::Public(_)),
+        is_const: true,
+        is_static: false,
+        doc: extract_doc(&item_const.attrs),
+        attributes: extract_attributes(&item_const.attrs, src),
+    }
+}
+
+fn extract_variable_info_static(item_static: &ItemStatic, src: &str) -> VariableInfo {
+    VariableInfo {
+        name: item_static.ident.to_string(),
+        type_name: source_text(&*item_static.ty, src),
+        value: Some(source_text(&*item_static.expr, src)),
+        line: item_static.span().start().line,
+        is_exported: matches!(item_static.vis, syn::Visibility::Public(_)),
+        is_const: false,
+        is_static: true,
+        doc: extract_doc(&item_static.attrs),
+        attributes: extract_attributes(&item_static.attrs, src),
+    }
+}
+
+fn extract_impl_info(item_impl: &ItemImpl, src: &str) -> ImplInfo {
+    let target_type = source_text(&*item_impl.self_ty, src);
+    let trait_name = item_impl.trait_.as_ref().map(|(_, path, _)| source_text(path, src));
+    let (generics, lifetimes, where_clause) = extract_generics(&item_impl.generics, src);
+
+    let methods = item_impl
+        .items
+        .iter()
+        .filter_map(|item| match item {
+            syn::ImplItem::Fn(method) => Some(extract_signature_info(
+                &method.sig,
+                method.span().start().line,
+                matches!(method.vis, syn::Visibility::Public(_)),
+                &method.attrs,
+                src,
+            )),
+            _ => None,
+        })
+        .collect();
+
+    ImplInfo {
+        target_type,
+        trait_name,
+        methods,
+        line: item_impl.span().start().line,
+        is_unsafe: item_impl.unsafety.is_some(),
+        generics,
+        lifetimes,
+        where_clause,
+    }
+}
+
+fn extract_macro_info(item_macro: &syn::ItemMacro, src: &str) -> MacroInfo {
+    // `macro_rules! name` defines `name`; any other item-position macro is a call to its path
+    let name = match &item_macro.ident {
+        Some(ident) => ident.to_string(),
+        None => source_text(&item_macro.mac.path, src),
+    };
+
+    // The macro from its path through the closing delimiter or semicolon, without attributes
+    let start = item_macro.mac.path.span().byte_range().start;
+    let end = match &item_macro.semi_token {
+        Some(semi) => semi.span.byte_range().end,
+        None => item_macro.mac.span().byte_range().end,
+    };
+    let content = match src.get(start..end) {
+        Some(text) if !text.is_empty() => text.to_string(),
+        _ => { let v = &item_macro.mac; quote!(#v) }.to_string(),
+    };
+
+    MacroInfo {
+        name,
+        content,
+        line: item_macro.span().start().line,
+        is_exported: item_macro.attrs.iter().any(|attr| attr.path().is_ident("macro_export")),
+    }
+}
+
+// Copy a node's text straight out of the source by its span, which avoids
+// re-rendering tokens and keeps the original formatting. Falls back to the
+// token rendering when the span does not map back into the source.
+fn source_text<T: ToTokens>(node: &T, src: &str) -> String {
+    match src.get(node.span().byte_range()) {
+        Some(text) if !text.is_empty() => text.to_string(),
+        _ => quote!(#node).to_string(),
+    }
+}
+
+// The string value of a #[doc = "..."] attribute or doc comment
+fn doc_value(attr: &Attribute) -> Option<String> {
+    if !attr.path().is_ident("doc") {
+        return None;
+    }
+    match &attr.meta.require_name_value().ok()?.value {
+        syn::Expr::Lit(syn::ExprLit { lit: syn::Lit::Str(lit_str), .. }) => Some(lit_str.value()),
+        _ => None,
+    }
+}
+
+fn extract_doc(attrs: &[Attribute]) -> String {
+    attrs.iter().filter_map(doc_value).collect::<Vec<_>>().join("\n")
+}
+
+fn extract_attributes(attrs: &[Attribute], src: &str) -> Vec<String> {
+    attrs
+        .iter()
+        .map(|attr| {
+            let text = source_text(attr, src);
+            if text.starts_with('#') {
+                return text;
+            }
+            // Doc comments are sugar for #[doc = "..."]; report them in that form
+            match doc_value(attr) {
+                Some(value) => {
+                    let bang = if matches!(attr.style, syn::AttrStyle::Inner(_)) { "!" } else { "" };
+                    format!("#{}[doc = {}]", bang, serde_json::to_string(&value).unwrap_or_default())
+                }
+                None => text,
+            }
+        })
+        .collect()
+}
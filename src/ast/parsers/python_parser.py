@@ -7,7 +7,14 @@ Python-specific AST parsing using built-in ast module.
 import ast
 import sys
 import time
+import os
 import asyncio
+import atexit
+import functools
+import inspect
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Dict, Any, Optional, Union
 
 from ..core.base_parser import (
@@ -23,48 +30,224 @@ from ..core.base_parser import (
     Variable,
 )
 
+_PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}"
+
+# Authoritative list of top-level standard library modules (Python 3.10+)
+_STDLIB_MODULES = frozenset(sys.stdlib_module_names)
+
+
+@functools.lru_cache(maxsize=2048)
+def _is_stdlib_module(module_name: str) -> bool:
+    """Check if a dotted module name belongs to the standard library"""
+    return module_name.partition(".")[0] in _STDLIB_MODULES
+
+
+# Type names for container literals on the right-hand side of an assignment
+_LITERAL_TYPE_NAMES = {
+    ast.List: "list",
+    ast.Dict: "dict",
+    ast.Set: "set",
+    ast.Tuple: "tuple",
+}
+
+# Nodes that each add one decision point to cyclomatic complexity
+_BRANCH_TYPES = frozenset(
+    {
+        ast.If,
+        ast.While,
+        ast.For,
+        ast.AsyncFor,
+        ast.ExceptHandler,
+        ast.With,
+        ast.AsyncWith,
+    }
+)
+
+_FUNCTION_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+
+# Nested scopes don't add to the enclosing function; nested definitions are scored on their own
+_NESTED_SCOPE_TYPES = frozenset(
+    {ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda}
+)
+
+
+def _get_docstring(node: ast.AST) -> Optional[str]:
+    """Return a definition's cleaned docstring, reading only its first statement"""
+    if node.body:
+        first = node.body[0]
+        if type(first) is ast.Expr:
+            value = first.value
+            if type(value) is ast.Constant and type(value.value) is str:
+                return inspect.cleandoc(value.value)
+    return None
+
+
+def _is_blank_source(content: str) -> bool:
+    """Check if source holds nothing but whitespace and comments"""
+    if not content or content.isspace():
+        return True
+    for line in content.splitlines():
+        stripped = line.lstrip()
+        if stripped and not stripped.startswith("#"):
+            return False
+    return True
+
+
+# Stack marker closing the innermost scope once its subtree has been visited
+_SCOPE_END = object()
+
+
+class _Collector:
+    """Single-pass visitor that gathers functions, classes, imports and variables"""
+
+    def __init__(self, parser: "PythonParser"):
+        self.parser = parser
+        self.functions: List[Function] = []
+        self.classes: List[Class] = []
+        self.imports: List[Import] = []
+        self.variables: List[Variable] = []
+        self.node_count = 0
+        self.total_complexity = 0
+        # Enclosing scopes: class name for a class body, None for a function body
+        self._scope_stack: List[Optional[str]] = []
+        # Method docstrings already read while building their class
+        self._method_docstrings: Dict[ast.AST, Optional[str]] = {}
+        self._stack: List[Any] = []
+
+    def visit(self, node: ast.AST) -> None:
+        """Walk the tree depth-first with an explicit stack, counting every node"""
+        stack = self._stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is _SCOPE_END:
+                self._scope_stack.pop()
+                continue
+            self.node_count += 1
+            handler = self._DISPATCH.get(type(node))
+            if handler is not None:
+                handler(self, node)
+            # Reversed so children are visited in source order
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+    def _enter_scope(self, name: Optional[str]) -> None:
+        """Open a scope that closes once the current node's children are visited"""
+        self._scope_stack.append(name)
+        self._stack.append(_SCOPE_END)
+
+    def _on_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> None:
+        class_name = self._scope_stack[-1] if self._scope_stack else None
+        if node in self._method_docstrings:
+            docstring = self._method_docstrings.pop(node)
+        else:
+            docstring = _get_docstring(node)
+        function = self.parser._function_from_node(node, class_name, docstring)
+        self.functions.append(function)
+        self.total_complexity += function.complexity_score
+        self._enter_scope(None)
+
+    def _on_class(self, node: ast.ClassDef) -> None:
+        class_obj = self.parser._class_from_node(node)
+        self.classes.append(class_obj)
+        method_nodes = [item for item in node.body if type(item) in _FUNCTION_TYPES]
+        for item, method in zip(method_nodes, class_obj.methods):
+            self._method_docstrings[item] = method.docstring
+        self._enter_scope(node.name)
+
+    def _on_import(self, node: Union[ast.Import, ast.ImportFrom]) -> None:
+        self.imports.extend(self.parser._imports_from_node(node))
+
+    def _on_assign(self, node: Union[ast.Assign, ast.AnnAssign]) -> None:
+        # Only assignments outside every class and function are module variables
+        if not self._scope_stack:
+            self.variables.extend(self.parser._variables_from_node(node))
+
+    # Exact-type lookup avoids NodeVisitor's per-node getattr name building
+    _DISPATCH = {
+        ast.FunctionDef: _on_function,
+        ast.AsyncFunctionDef: _on_function,
+        ast.ClassDef: _on_class,
+        ast.Import: _on_import,
+        ast.ImportFrom: _on_import,
+        ast.Assign: _on_assign,
+        ast.AnnAssign: _on_assign,
+    }
+
 
 class PythonParser(BaseParser):
     """Python-specific AST parser using built-in ast module"""
 
+    # Worker pool shared by every instance; ast.parse is CPU-bound and holds the GIL
+    _pool: Optional[ProcessPoolExecutor] = None
+    # Instances that have used the pool and not closed yet; the last close shuts it down
+    _pool_users = 0
+    _pool_lock = threading.Lock()
+
     def __init__(self):
         super().__init__()
         self.language = Language.PYTHON
+        self.max_concurrent_files = 64  # Cap on files open/in flight per batch
+        self._uses_pool = False
 
     def get_supported_extensions(self) -> List[str]:
         """Return list of supported file extensions."""
         return [".py", ".pyx", ".pyd"]
 
-    async def parse_file(self, file_path: str, content: str) -> ASTResult:
+    async def parse_file(
+        self, file_path: str, content: str, keep_tree: bool = True
+    ) -> ASTResult:
         """
         Parse Python file content into AST
 
         Args:
             file_path: Path to the Python file
             content: File content as string
+            keep_tree: Whether to return the syntax tree in ast_root
 
         Returns:
             ASTResult with parsed structure
         """
+        return self._parse_content(file_path, content, keep_tree)
+
+    def _parse_content(
+        self, file_path: str, content: str, keep_tree: bool = True
+    ) -> ASTResult:
+        """Synchronous parse pipeline shared by parse_file and pool workers"""
         start_time = time.time()
 
+        # Empty and comment-only files (e.g. bare __init__.py) have nothing to extract
+        if _is_blank_source(content):
+            return ASTResult(
+                success=True,
+                language=self.language,
+                ast_root=ast.Module(body=[], type_ignores=[]) if keep_tree else None,
+                functions=[],
+                classes=[],
+                imports=[],
+                variables=[],
+                metadata={
+                    "file_path": file_path,
+                    "encoding": "utf-8",
+                    "python_version": _PYTHON_VERSION,
+                    "node_count": 1,
+                    "complexity_score": 0,
+                },
+                parse_time_ms=int((time.time() - start_time) * 1000),
+            )
+
         try:
             # Parse using built-in ast module
             tree = ast.parse(content, filename=file_path)
 
-            # Extract information
-            functions = self.extract_functions(tree)
-            classes = self.extract_classes(tree)
-            imports = self.extract_imports(tree)
-            variables = self.extract_variables(tree)
+            # Extract information in a single traversal
+            collector = self._collect(tree)
 
             # Build metadata
             metadata = {
                 "file_path": file_path,
                 "encoding": "utf-8",
-                "python_version": f"{sys.version_info.major}.{sys.version_info.minor}",
-                "node_count": self._count_nodes(tree),
-                "complexity_score": self._calculate_complexity(tree),
+                "python_version": _PYTHON_VERSION,
+                "node_count": collector.node_count,
+                "complexity_score": collector.total_complexity,
             }
 
             parse_time = int((time.time() - start_time) * 1000)
@@ -72,11 +255,11 @@ class PythonParser(BaseParser):
             return ASTResult(
                 success=True,
                 language=self.language,
-                ast_root=tree,
-                functions=functions,
-                classes=classes,
-                imports=imports,
-                variables=variables,
+                ast_root=tree if keep_tree else None,
+                functions=collector.functions,
+                classes=collector.classes,
+                imports=collector.imports,
+                variables=collector.variables,
                 metadata=metadata,
                 parse_time_ms=parse_time,
             )
@@ -98,203 +281,264 @@ class PythonParser(BaseParser):
                 parse_time_ms=parse_time,
             )
 
-    async def parse_batch(self, file_paths: List[str]) -> List[ASTResult]:
-        """Parse multiple files in parallel."""
-        tasks = []
-        for file_path in file_paths:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                tasks.append(self.parse_file(file_path, content))
-            except Exception as e:
-                # Create error result for files that can't be read
-                error_msg = str(e)
-
-                async def error_result():
-                    return ASTResult(
-                        success=False,
-                        language=self.language,
-                        error=f"Cannot read file: {error_msg}",
-                    )
+    async def parse_batch(
+        self, file_paths: List[str], keep_tree: bool = False
+    ) -> List[ASTResult]:
+        """Parse multiple files in parallel across worker processes.
 
-                tasks.append(error_result())
+        Syntax trees are dropped unless keep_tree is set, so large batches do
+        not pin every file's AST in memory.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrent_files)
+
+        async def parse_one(file_path: str) -> ASTResult:
+            async with semaphore:
+                # A worker that dies breaks the whole pool; retry once on a new one
+                for _ in range(2):
+                    pool = self._get_pool()
+                    try:
+                        return await loop.run_in_executor(
+                            pool, _parse_worker, file_path, keep_tree
+                        )
+                    except BrokenProcessPool as e:
+                        self._discard_pool(pool)
+                        error = e
+                return ASTResult(
+                    success=False,
+                    language=self.language,
+                    error=f"Parser worker failed: {error}",
+                )
 
-        return await asyncio.gather(*tasks)
+        return await asyncio.gather(*(parse_one(path) for path in file_paths))
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the shared batch parsing pool, creating it on first use"""
+        cls = PythonParser
+        with cls._pool_lock:
+            if not self._uses_pool:
+                self._uses_pool = True
+                cls._pool_users += 1
+            if cls._pool is None:
+                cls._pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(), initializer=_worker_init
+                )
+            return cls._pool
+
+    @classmethod
+    def _discard_pool(cls, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool so the next batch starts a fresh one"""
+        with cls._pool_lock:
+            if cls._pool is not pool:
+                return
+            cls._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _shutdown_pool(cls) -> None:
+        """Shut down the shared worker pool, whoever still uses it"""
+        with cls._pool_lock:
+            pool, cls._pool = cls._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def close(self) -> None:
+        """Release the shared worker pool, shutting it down once no instance uses it"""
+        cls = PythonParser
+        with cls._pool_lock:
+            if not self._uses_pool:
+                return
+            self._uses_pool = False
+            cls._pool_users -= 1
+            if cls._pool_users:
+                return
+            pool, cls._pool = cls._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    async def __aenter__(self) -> "PythonParser":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def extract_functions(self, ast_root: ast.AST) -> List[Function]:
         """Extract function definitions from AST"""
-        functions = []
-
-        for node in ast.walk(ast_root):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Extract parameters
-                parameters = []
-                for arg in node.args.args:
-                    param_type = (
-                        self._get_type_annotation(arg.annotation)
-                        if arg.annotation
-                        else ""
-                    )
-                    parameters.append(
-                        Parameter(
-                            name=arg.arg,
-                            type_hint=param_type,
-                            default_value=None,  # TODO: Extract default values
-                            is_optional=False,
-                            docstring=None,
-                        )
-                    )
+        return self._collect(ast_root).functions
 
-                # Handle *args
-                if node.args.vararg:
-                    vararg_type = (
-                        self._get_type_annotation(node.args.vararg.annotation)
-                        if node.args.vararg.annotation
-                        else ""
-                    )
-                    parameters.append(
-                        Parameter(
-                            name=f"*{node.args.vararg.arg}",
-                            type_hint=vararg_type,
-                            default_value=None,
-                            is_optional=False,
-                            docstring=None,
-                        )
-                    )
+    def extract_classes(self, ast_root: ast.AST) -> List[Class]:
+        """Extract class definitions from AST"""
+        return self._collect(ast_root).classes
 
-                # Handle **kwargs
-                if node.args.kwarg:
-                    kwarg_type = (
-                        self._get_type_annotation(node.args.kwarg.annotation)
-                        if node.args.kwarg.annotation
-                        else ""
-                    )
-                    parameters.append(
-                        Parameter(
-                            name=f"**{node.args.kwarg.arg}",
-                            type_hint=kwarg_type,
-                            default_value=None,
-                            is_optional=False,
-                            docstring=None,
-                        )
-                    )
+    def extract_imports(self, ast_root: ast.AST) -> List[Import]:
+        """Extract import statements from AST"""
+        return self._collect(ast_root).imports
 
-                # Extract return type
-                return_type = (
-                    self._get_type_annotation(node.returns) if node.returns else ""
+    def extract_variables(self, ast_root: ast.AST) -> List[Variable]:
+        """Extract variable definitions from AST"""
+        return self._collect(ast_root).variables
+
+    def _collect(self, ast_root: ast.AST) -> "_Collector":
+        """Run the fused extractor visitor over the tree once"""
+        collector = _Collector(self)
+        collector.visit(ast_root)
+        return collector
+
+    def _function_from_node(
+        self,
+        node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        class_name: Optional[str] = None,
+        docstring: Optional[str] = None,
+    ) -> Function:
+        """Build a Function from a definition node, its class and its docstring"""
+        # Extract parameters
+        parameters = []
+        defaults = self._get_defaults(node.args)
+        for arg, default in zip(node.args.args, defaults):
+            param_type = (
+                self._get_type_annotation(arg.annotation) if arg.annotation else ""
+            )
+            parameters.append(
+                Parameter(
+                    name=arg.arg,
+                    type_hint=param_type,
+                    default_value=default,
+                    is_optional=False,
+                    docstring=None,
                 )
+            )
 
-                # Extract decorators
-                decorators = []
-                for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Name):
-                        decorators.append(decorator.id)
-                    elif isinstance(decorator, ast.Attribute):
-                        decorators.append(self._get_attribute_name(decorator))
-
-                # Extract docstring
-                docstring = ast.get_docstring(node) or ""
-
-                # Calculate complexity
-                complexity = self._calculate_function_complexity(node)
-
-                # Check if function is a method
-                is_method, class_name = self._is_method(node, ast_root)
+        # Handle *args
+        if node.args.vararg:
+            vararg_type = (
+                self._get_type_annotation(node.args.vararg.annotation)
+                if node.args.vararg.annotation
+                else ""
+            )
+            parameters.append(
+                Parameter(
+                    name=f"*{node.args.vararg.arg}",
+                    type_hint=vararg_type,
+                    default_value=None,
+                    is_optional=False,
+                    docstring=None,
+                )
+            )
 
-                function = Function(
-                    name=node.name,
-                    parameters=parameters,
-                    return_type=return_type,
-                    decorators=decorators,
-                    line_number=node.lineno,
-                    docstring=docstring,
-                    complexity_score=complexity,
-                    is_async=isinstance(node, ast.AsyncFunctionDef),
-                    is_method=is_method,
-                    class_name=class_name,
+        # Handle **kwargs
+        if node.args.kwarg:
+            kwarg_type = (
+                self._get_type_annotation(node.args.kwarg.annotation)
+                if node.args.kwarg.annotation
+                else ""
+            )
+            parameters.append(
+                Parameter(
+                    name=f"**{node.args.kwarg.arg}",
+                    type_hint=kwarg_type,
+                    default_value=None,
+                    is_optional=False,
+                    docstring=None,
                 )
+            )
 
-                functions.append(function)
+        # Extract return type
+        return_type = self._get_type_annotation(node.returns) if node.returns else ""
 
-        return functions
+        # Extract decorators
+        decorators = []
+        for decorator in node.decorator_list:
+            if type(decorator) is ast.Name:
+                decorators.append(decorator.id)
+            elif type(decorator) is ast.Attribute:
+                decorators.append(self._get_attribute_name(decorator))
 
-    def extract_classes(self, ast_root: ast.AST) -> List[Class]:
-        """Extract class definitions from AST"""
-        classes = []
-
-        for node in ast.walk(ast_root):
-            if isinstance(node, ast.ClassDef):
-                # Extract base classes
-                base_classes = []
-                for base in node.bases:
-                    if isinstance(base, ast.Name):
-                        base_classes.append(base.id)
-                    elif isinstance(base, ast.Attribute):
-                        base_classes.append(self._get_attribute_name(base))
-
-                # Extract decorators
-                decorators = []
-                for decorator in node.decorator_list:
-                    if isinstance(decorator, ast.Name):
-                        decorators.append(decorator.id)
-                    elif isinstance(decorator, ast.Attribute):
-                        decorators.append(self._get_attribute_name(decorator))
-
-                # Extract docstring
-                docstring = ast.get_docstring(node) or ""
-
-                # Extract methods
-                methods = []
-                properties = []
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        method_info = self._extract_method_info(item)
-                        methods.append(method_info)
-                    elif isinstance(item, ast.AnnAssign) and isinstance(
-                        item.target, ast.Name
-                    ):
-                        if self._is_property(item):
-                            prop_type = (
-                                self._get_type_annotation(item.annotation)
-                                if item.annotation
-                                else ""
-                            )
-                            properties.append(
-                                Property(
-                                    name=item.target.id,
-                                    type_hint=prop_type,
-                                    line_number=item.lineno,
-                                    default_value=None,
-                                    access_level="public",
-                                    docstring=None,
-                                    is_property=True,
-                                )
-                            )
-
-                class_obj = Class(
-                    name=node.name,
-                    base_classes=base_classes,
-                    methods=methods,
-                    properties=properties,
-                    decorators=decorators,
-                    docstring=docstring,
-                    line_number=node.lineno,
-                    is_abstract=self._is_abstract_class(node),
-                    access_level="public",  # Python doesn't have explicit access levels
-                )
+        # Calculate complexity
+        complexity = self._calculate_function_complexity(node)
 
-                classes.append(class_obj)
+        return Function(
+            name=node.name,
+            parameters=parameters,
+            return_type=return_type,
+            decorators=decorators,
+            line_number=node.lineno,
+            docstring=docstring,
+            complexity_score=complexity,
+            is_async=type(node) is ast.AsyncFunctionDef,
+            is_method=class_name is not None,
+            class_name=class_name,
+        )
 
-        return classes
+    def _class_from_node(self, node: ast.ClassDef) -> Class:
+        """Build a Class from a class definition node"""
+        # Extract base classes
+        base_classes = []
+        for base in node.bases:
+            if type(base) is ast.Name:
+                base_classes.append(base.id)
+            elif type(base) is ast.Attribute:
+                base_classes.append(self._get_attribute_name(base))
+
+        # Extract decorators
+        decorators = []
+        for decorator in node.decorator_list:
+            if type(decorator) is ast.Name:
+                decorators.append(decorator.id)
+            elif type(decorator) is ast.Attribute:
+                decorators.append(self._get_attribute_name(decorator))
+
+        # Extract docstring
+        docstring = _get_docstring(node)
+
+        # Extract methods
+        methods = []
+        properties = []
+        for item in node.body:
+            item_type = type(item)
+            if item_type in _FUNCTION_TYPES:
+                method_info = self._extract_method_info(item)
+                methods.append(method_info)
+            elif item_type is ast.AnnAssign and type(item.target) is ast.Name:
+                if self._is_property(item):
+                    prop_type = (
+                        self._get_type_annotation(item.annotation)
+                        if item.annotation
+                        else ""
+                    )
+                    properties.append(
+                        Property(
+                            name=item.target.id,
+                            type_hint=prop_type,
+                            line_number=item.lineno,
+                            default_value=None,
+                            access_level="public",
+                            docstring=None,
+                            is_property=True,
+                        )
+                    )
 
-    def extract_imports(self, ast_root: ast.AST) -> List[Import]:
-        """Extract import statements from AST"""
+        return Class(
+            name=node.name,
+            base_classes=base_classes,
+            methods=methods,
+            properties=properties,
+            decorators=decorators,
+            docstring=docstring,
+            line_number=node.lineno,
+            is_abstract=self._is_abstract_class(node),
+            access_level="public",  # Python doesn't have explicit access levels
+        )
+
+    def _imports_from_node(
+        self, node: Union[ast.Import, ast.ImportFrom]
+    ) -> List[Import]:
+        """Build Import entries from an import statement node"""
         imports = []
 
-        for node in ast.walk(ast_root):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    import_obj = Import(
+        if type(node) is ast.Import:
+            for alias in node.names:
+                imports.append(
+                    Import(
                         module=alias.name,
                         name=alias.asname if alias.asname else alias.name,
                         alias=alias.asname,
@@ -303,13 +547,13 @@ class PythonParser(BaseParser):
                         is_relative=False,
                         is_standard_library=self._is_standard_library(alias.name),
                     )
-                    imports.append(import_obj)
-
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                is_relative = node.level > 0
-                for alias in node.names:
-                    import_obj = Import(
+                )
+        else:
+            module = node.module or ""
+            is_relative = node.level > 0
+            for alias in node.names:
+                imports.append(
+                    Import(
                         module=module,
                         name=alias.name,
                         alias=alias.asname,
@@ -320,50 +564,44 @@ class PythonParser(BaseParser):
                             self._is_standard_library(module) if module else False
                         ),
                     )
-                    imports.append(import_obj)
+                )
 
         return imports
 
-    def extract_variables(self, ast_root: ast.AST) -> List[Variable]:
-        """Extract variable definitions from AST"""
+    def _variables_from_node(
+        self, node: Union[ast.Assign, ast.AnnAssign]
+    ) -> List[Variable]:
+        """Build Variable entries from a module-level assignment node"""
         variables = []
 
-        # Track assignments at module level
-        for node in ast.walk(ast_root):
-            if isinstance(node, ast.Assign):
-                # Only process module-level assignments
-                if self._is_module_level(node, ast_root):
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            var_type = self._infer_variable_type(node.value)
-                            variable = Variable(
-                                name=target.id,
-                                type_hint=var_type or "",
-                                default_value=None,  # TODO: Extract actual values
-                                line_number=node.lineno,
-                                is_global=True,
-                                is_constant=False,
-                            )
-                            variables.append(variable)
-
-            elif isinstance(node, ast.AnnAssign):
-                # Only process module-level annotated assignments
-                if self._is_module_level(node, ast_root):
-                    if isinstance(node.target, ast.Name):
-                        var_type = (
-                            self._get_type_annotation(node.annotation)
-                            if node.annotation
-                            else ""
-                        )
-                        variable = Variable(
-                            name=node.target.id,
-                            type_hint=var_type,
-                            default_value=None,
+        if type(node) is ast.Assign:
+            for target in node.targets:
+                if type(target) is ast.Name:
+                    var_type = self._infer_variable_type(node.value)
+                    variables.append(
+                        Variable(
+                            name=target.id,
+                            type_hint=var_type or "",
+                            default_value=None,  # TODO: Extract actual values
                             line_number=node.lineno,
                             is_global=True,
                             is_constant=False,
                         )
-                        variables.append(variable)
+                    )
+        elif type(node.target) is ast.Name:
+            var_type = (
+                self._get_type_annotation(node.annotation) if node.annotation else ""
+            )
+            variables.append(
+                Variable(
+                    name=node.target.id,
+                    type_hint=var_type,
+                    default_value=None,
+                    line_number=node.lineno,
+                    is_global=True,
+                    is_constant=False,
+                )
+            )
 
         return variables
 
@@ -371,88 +609,50 @@ class PythonParser(BaseParser):
         """Convert type annotation to string"""
         if annotation is None:
             return ""
-
-        if isinstance(annotation, ast.Name):
-            return annotation.id
-        elif isinstance(annotation, ast.Attribute):
-            return self._get_attribute_name(annotation)
-        elif isinstance(annotation, ast.Subscript):
-            base = self._get_type_annotation(annotation.value)
-            # Handle different slice types for different Python versions
-            if sys.version_info >= (3, 9):
-                slice_val = self._get_type_annotation(annotation.slice)
-            else:
-                # For Python < 3.9, slice is an Index node
-                slice_val = self._get_type_annotation(
-                    annotation.slice.value
-                    if hasattr(annotation.slice, "value")
-                    else annotation.slice
-                )
-            return f"{base}[{slice_val}]"
-        elif isinstance(annotation, ast.List):
-            elements = [self._get_type_annotation(elt) for elt in annotation.elts]
-            return f"[{', '.join(elements)}]"
-        elif isinstance(annotation, ast.Tuple):
-            elements = [self._get_type_annotation(elt) for elt in annotation.elts]
-            return f"({', '.join(elements)})"
-        else:
-            return str(type(annotation).__name__)
+        # Quoted forward references are reported without their quotes
+        if type(annotation) is ast.Constant and type(annotation.value) is str:
+            return sys.intern(annotation.value)
+        # Annotation strings repeat heavily across a codebase ("int", "str", ...)
+        return sys.intern(ast.unparse(annotation))
+
+    def _get_defaults(self, args: ast.arguments) -> List[Optional[str]]:
+        """Render the default of each positional parameter, None where it has none"""
+        # Defaults belong to the last positional parameters, positional-only included
+        missing = len(args.posonlyargs) + len(args.args) - len(args.defaults)
+        rendered = [None] * missing + [ast.unparse(d) for d in args.defaults]
+        return rendered[len(args.posonlyargs) :]
 
     def _get_attribute_name(self, node: ast.Attribute) -> str:
         """Get full attribute name (e.g., module.Class.method)"""
-        if isinstance(node.value, ast.Name):
-            return f"{node.value.id}.{node.attr}"
-        elif isinstance(node.value, ast.Attribute):
-            return f"{self._get_attribute_name(node.value)}.{node.attr}"
-        else:
-            return node.attr
+        return sys.intern(ast.unparse(node))
 
     def _calculate_function_complexity(
         self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
     ) -> int:
-        """Calculate cyclomatic complexity of a function"""
+        """Calculate cyclomatic complexity of a function, excluding nested scopes"""
         complexity = 1  # Base complexity
-
-        for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-            elif isinstance(child, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(child, (ast.With, ast.AsyncWith)):
+        stack = list(ast.iter_child_nodes(node))
+
+        while stack:
+            child = stack.pop()
+            child_type = type(child)
+            if child_type in _NESTED_SCOPE_TYPES:
+                continue
+            if child_type in _BRANCH_TYPES:
                 complexity += 1
-            elif isinstance(child, ast.BoolOp):
+            elif child_type is ast.BoolOp:
                 complexity += len(child.values) - 1
+            stack.extend(ast.iter_child_nodes(child))
 
         return complexity
 
-    def _calculate_complexity(self, tree: ast.AST) -> int:
-        """Calculate overall file complexity"""
-        total_complexity = 0
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                total_complexity += self._calculate_function_complexity(node)
-        return total_complexity
-
-    def _count_nodes(self, tree: ast.AST) -> int:
-        """Count total AST nodes"""
-        return len(list(ast.walk(tree)))
-
-    def _is_method(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], tree: ast.AST
-    ) -> tuple[bool, Optional[str]]:
-        """Check if function is a method inside a class and return class name"""
-        for parent in ast.walk(tree):
-            if isinstance(parent, ast.ClassDef):
-                if node in parent.body:
-                    return True, parent.name
-        return False, None
-
     def _extract_method_info(
         self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
     ) -> Method:
         """Extract method information"""
         parameters = []
-        for arg in node.args.args:
+        defaults = self._get_defaults(node.args)
+        for arg, default in zip(node.args.args, defaults):
             param_type = (
                 self._get_type_annotation(arg.annotation) if arg.annotation else ""
             )
@@ -460,7 +660,7 @@ class PythonParser(BaseParser):
                 Parameter(
                     name=arg.arg,
                     type_hint=param_type,
-                    default_value=None,
+                    default_value=default,
                     is_optional=False,
                     docstring=None,
                 )
@@ -469,11 +669,10 @@ class PythonParser(BaseParser):
         return_type = self._get_type_annotation(node.returns) if node.returns else ""
         decorators = []
         for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Name):
+            if type(decorator) is ast.Name:
                 decorators.append(decorator.id)
 
-        docstring = ast.get_docstring(node) or ""
-        complexity = self._calculate_function_complexity(node)
+        docstring = _get_docstring(node)
 
         return Method(
             name=node.name,
@@ -484,7 +683,7 @@ class PythonParser(BaseParser):
             docstring=docstring,
             access_level="public",
             is_static="staticmethod" in decorators,
-            is_async=isinstance(node, ast.AsyncFunctionDef),
+            is_async=type(node) is ast.AsyncFunctionDef,
         )
 
     def _is_property(self, node: ast.AnnAssign) -> bool:
@@ -495,72 +694,48 @@ class PythonParser(BaseParser):
     def _is_abstract_class(self, node: ast.ClassDef) -> bool:
         """Check if class is abstract"""
         for decorator in node.decorator_list:
-            if isinstance(decorator, ast.Name) and decorator.id == "abstractmethod":
+            if type(decorator) is ast.Name and decorator.id == "abstractmethod":
                 return True
         return False
 
-    def _is_module_level(self, node: ast.AST, tree: ast.AST) -> bool:
-        """Check if node is at module level"""
-        # Simple implementation - could be improved
-        return isinstance(tree, ast.Module) and node in tree.body
-
     def _infer_variable_type(self, value: ast.AST) -> Optional[str]:
         """Infer variable type from assignment value"""
-        if isinstance(value, ast.Constant):
+        value_type = type(value)
+        if value_type is ast.Constant:
             return type(value.value).__name__
-        elif isinstance(value, ast.List):
-            return "list"
-        elif isinstance(value, ast.Dict):
-            return "dict"
-        elif isinstance(value, ast.Set):
-            return "set"
-        elif isinstance(value, ast.Tuple):
-            return "tuple"
-        elif isinstance(value, ast.Call):
-            if isinstance(value.func, ast.Name):
-                return value.func.id
-        return None
+        if value_type is ast.Call and type(value.func) is ast.Name:
+            return value.func.id
+        return _LITERAL_TYPE_NAMES.get(value_type)
 
     def _is_standard_library(self, module_name: str) -> bool:
         """Check if import is from Python standard library"""
-        stdlib_modules = {
-            "os",
-            "sys",
-            "json",
-            "datetime",
-            "time",
-            "math",
-            "random",
-            "re",
-            "collections",
-            "itertools",
-            "functools",
-            "operator",
-            "pathlib",
-            "urllib",
-            "http",
-            "socket",
-            "ssl",
-            "hashlib",
-            "hmac",
-            "secrets",
-            "threading",
-            "multiprocessing",
-            "concurrent",
-            "asyncio",
-            "logging",
-            "unittest",
-            "argparse",
-            "configparser",
-            "tempfile",
-            "shutil",
-            "glob",
-            "fnmatch",
-            "pickle",
-            "csv",
-            "sqlite3",
-        }
-
-        # Check if it's a standard library module
-        base_module = module_name.split(".")[0]
-        return base_module in stdlib_modules
+        return _is_stdlib_module(module_name)
+
+
+atexit.register(PythonParser._shutdown_pool)
+
+
+# Parser owned by each pool worker process, built once by _worker_init
+_worker_parser: Optional[PythonParser] = None
+
+
+def _worker_init() -> None:
+    """Warm up a pool worker so its first task skips setup cost"""
+    global _worker_parser
+    _worker_parser = PythonParser()
+
+
+def _parse_worker(file_path: str, keep_tree: bool = False) -> ASTResult:
+    """Read and parse a single file inside a pool worker process"""
+    parser = _worker_parser or PythonParser()
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    except Exception as e:
+        return ASTResult(
+            success=False,
+            language=parser.language,
+            error=f"Cannot read file: {str(e)}",
+        )
+
+    return parser._parse_content(file_path, content, keep_tree)
@@ -1,12 +1,37 @@
 """Rust language AST parser implementation."""
 
 import asyncio
+import copy
+import functools
+import hashlib
 import subprocess
-import tempfile
 import os
+import shutil
+import sqlite3
+import struct
+import sys
+import threading
 import time
 import json
-from typing import Dict, List, Any, Optional
+import re
+import select
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Try to import tree-sitter, falling back to the syn-based parser binary
+try:
+    import tree_sitter
+    import tree_sitter_rust
+
+    TREE_SITTER_RUST_AVAILABLE = True
+except ImportError:
+    TREE_SITTER_RUST_AVAILABLE = False
 
 from ..core.base_parser import (
     BaseParser,
@@ -21,943 +46,1290 @@ from ..core.base_parser import (
     Variable,
 )
 
+_PARSER_BINARY_NAME = "reactor-rust-ast-parser"
+
+# cargo install root for the parser binary when it is not provided externally
+_PARSER_INSTALL_ROOT = Path.home() / ".reactor"
+
+# Rust crate wrapping syn that prints the declarations of a source file as JSON
+_RUST_CRATE_DIR = Path(__file__).parent / "_rust_parser_crate"
+
+# Content-addressed on-disk cache of parser output
+_AST_CACHE_DB = _PARSER_INSTALL_ROOT / "cache" / "rust-ast.sqlite3"
+
+
+# Standard library crates and the std modules commonly imported on their own
+_STD_CRATES = frozenset(
+    {
+        "std",
+        "core",
+        "alloc",
+        "proc_macro",
+        "test",
+        "vec",
+        "string",
+        "collections",
+        "hash_map",
+        "hash_set",
+        "option",
+        "result",
+        "cell",
+        "rc",
+        "sync",
+        "arc",
+        "box",
+        "iter",
+        "slice",
+        "str",
+        "char",
+        "num",
+        "io",
+        "fs",
+        "path",
+        "env",
+        "process",
+        "thread",
+        "time",
+        "net",
+        "os",
+        "ffi",
+        "fmt",
+        "error",
+    }
+)
 
-class RustParser(BaseParser):
-    """Rust language parser using syn crate."""
-
-    def __init__(self):
-        super().__init__()
-        self.language = Language.RUST
-
-    def get_supported_extensions(self) -> List[str]:
-        """Return list of supported file extensions."""
-        return [".rs"]
-
-    async def parse_file(self, file_path: str, content: str) -> ASTResult:
-        """Parse Rust file and extract AST information."""
-        start_time = time.time()
-
-        try:
-            # Use syn via a temporary Rust program
-            ast_data = await asyncio.get_event_loop().run_in_executor(
-                None, self._extract_rust_ast, file_path, content
-            )
-
-            # Convert to ASTResult
-            functions = self._convert_functions(ast_data.get("functions", []))
-            classes = self._convert_structs(ast_data.get("structs", []))
-            classes.extend(self._convert_traits(ast_data.get("traits", [])))
-            classes.extend(self._convert_enums(ast_data.get("enums", [])))
-            imports = self._convert_imports(ast_data.get("imports", []))
-            variables = self._convert_variables(ast_data.get("variables", []))
-
-            parse_time = int((time.time() - start_time) * 1000)
-
-            return ASTResult(
-                success=True,
-                language=self.language,
-                functions=functions,
-                classes=classes,
-                imports=imports,
-                variables=variables,
-                metadata={
-                    "crate_name": ast_data.get("crate_name", ""),
-                    "modules": ast_data.get("modules", []),
-                    "macros": ast_data.get("macros", []),
-                    "traits": ast_data.get("traits", []),
-                    "impl_blocks": ast_data.get("impl_blocks", []),
-                    "unsafe_blocks": ast_data.get("unsafe_blocks", []),
-                    "lifetimes": ast_data.get("lifetimes", []),
-                },
-                parse_time_ms=parse_time,
-            )
-
-        except Exception as e:
-            parse_time = int((time.time() - start_time) * 1000)
-            return ASTResult(
-                success=False,
-                language=self.language,
-                error=str(e),
-                parse_time_ms=parse_time,
-            )
-
-    async def parse_batch(self, file_paths: List[str]) -> List[ASTResult]:
-        """Parse multiple files in parallel."""
-        tasks = []
-        for file_path in file_paths:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                tasks.append(self.parse_file(file_path, content))
-            except Exception as e:
-
-                async def error_result():
-                    return ASTResult(
-                        success=False,
-                        language=self.language,
-                        error=f"Cannot read file: {str(e)}",
-                    )
-
-                tasks.append(error_result())
-
-        return await asyncio.gather(*tasks)
-
-    def _extract_rust_ast(self, file_path: str, content: str) -> Dict[str, Any]:
-        """Extract AST information using Rust's syn crate."""
-        # Create a temporary Rust program to parse the file
-        rust_parser_code = """
-use syn::{Item, ItemFn, ItemStruct, ItemEnum, ItemTrait, ItemMod, ItemUse, ItemImpl, ItemConst, ItemStatic};
-use syn::{Attribute, Signature, Fields, Variant, Generics, WhereClause, TraitBound, Lifetime, TypeParam, ConstParam};
-use quote::quote;
-use std::collections::HashMap;
-use std::fs;
-use std::env;
-
-#[derive(Debug, serde::Serialize)]
-struct FunctionInfo {
-    name: String,
-    parameters: Vec<ParamInfo>,
-    return_type: String,
-    line: usize,
-    is_exported: bool,
-    is_unsafe: bool,
-    is_async: bool,
-    generics: Vec<String>,
-    lifetimes: Vec<String>,
-    where_clause: Option<String>,
-    doc: String,
-    attributes: Vec<String>,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct ParamInfo {
-    name: String,
-    type_name: String,
-    is_mut: bool,
-    is_reference: bool,
-    is_lifetime: bool,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct StructInfo {
-    name: String,
-    fields: Vec<FieldInfo>,
-    line: usize,
-    is_exported: bool,
-    generics: Vec<String>,
-    lifetimes: Vec<String>,
-    where_clause: Option<String>,
-    doc: String,
-    attributes: Vec<String>,
-    is_tuple: bool,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct FieldInfo {
-    name: String,
-    type_name: String,
-    is_pub: bool,
-    is_mut: bool,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct EnumInfo {
-    name: String,
-    variants: Vec<VariantInfo>,
-    line: usize,
-    is_exported: bool,
-    generics: Vec<String>,
-    lifetimes: Vec<String>,
-    where_clause: Option<String>,
-    doc: String,
-    attributes: Vec<String>,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct VariantInfo {
-    name: String,
-    fields: Vec<FieldInfo>,
-    is_tuple: bool,
-    is_unit: bool,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct TraitInfo {
-    name: String,
-    methods: Vec<FunctionInfo>,
-    line: usize,
-    is_exported: bool,
-    generics: Vec<String>,
-    lifetimes: Vec<String>,
-    where_clause: Option<String>,
-    supertraits: Vec<String>,
-    doc: String,
-    attributes: Vec<String>,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct ImportInfo {
-    path: String,
-    name: Option<String>,
-    alias: Option<String>,
-    line: usize,
-    is_glob: bool,
-    attributes: Vec<String>,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct VariableInfo {
-    name: String,
-    type_name: String,
-    value: Option<String>,
-    line: usize,
-    is_exported: bool,
-    is_const: bool,
-    is_static: bool,
-    doc: String,
-    attributes: Vec<String>,
-}
-
-#[derive(Debug, serde::Serialize)]
-struct ImplInfo {
-    target_type: String,
-    trait_name: Option<String>,
-    methods: Vec<FunctionInfo>,
-    line: usize,
-    is_unsafe: bool,
-    generics: Vec<String>,
-    lifetimes: Vec<String>,
-    where_clause: Option<String>,
-}
 
-#[derive(Debug, serde::Serialize)]
-struct MacroInfo {
-    name: String,
-    content: String,
-    line: usize,
-    is_exported: bool,
+@functools.lru_cache(maxsize=4096)
+def _is_std_crate(crate: str) -> bool:
+    """Check if the first segment of a use path names a standard library crate."""
+    return crate in _STD_CRATES
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_version() -> Optional[str]:
+    """Hash the parser crate source, or None if it is missing from this install."""
+    # Cached ASTs and the installed binary are tagged with it, so any change to
+    # the parser source invalidates them
+    try:
+        source = (_RUST_CRATE_DIR / "Cargo.toml").read_bytes() + (
+            _RUST_CRATE_DIR / "src" / "main.rs"
+        ).read_bytes()
+    except OSError:
+        return None
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    """Length of the longest common prefix, found by bisecting slice compares."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _point_at(source: bytes, offset: int) -> Tuple[int, int]:
+    """Return the (row, column) tree-sitter point of a byte offset."""
+    row = source.count(b"\n", 0, offset)
+    return row, offset - (source.rfind(b"\n", 0, offset) + 1)
+
+
+def _read_pipe(pipe: Any, size: int, deadline: float) -> bytes:
+    """Read exactly size bytes from a pipe, raising TimeoutError past the deadline."""
+    fd = pipe.fileno()
+    chunks = []
+    while size:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            raise TimeoutError("Rust parser daemon timed out")
+        chunk = os.read(fd, size)
+        if not chunk:
+            raise OSError("Rust parser daemon exited")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_source(file_path: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Read a source file, returning (path, content, error)."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return file_path, f.read(), None
+    except Exception as e:
+        return file_path, None, f"Cannot read file: {str(e)}"
+
+
+if TREE_SITTER_RUST_AVAILABLE:
+    try:
+        _TS_LANGUAGE = tree_sitter.Language(tree_sitter_rust.language())
+
+        def _ts_kind(name: str, named: bool = True) -> int:
+            """Return the numeric ID of a node kind in the Rust grammar."""
+            return _TS_LANGUAGE.id_for_node_kind(name, named)
+
+        # Node kind IDs, so tree walks compare small ints rather than strings
+        _TS_ATTRIBUTE_ITEM = _ts_kind("attribute_item")
+        _TS_VISIBILITY = _ts_kind("visibility_modifier")
+        _TS_OUTER_DOC_MARKER = _ts_kind("outer_doc_comment_marker")
+        _TS_INNER_ATTRIBUTE_ITEM = _ts_kind("inner_attribute_item")
+        _TS_INNER_DOC_MARKER = _ts_kind("inner_doc_comment_marker")
+        _TS_STRING_LITERAL = _ts_kind("string_literal")
+        _TS_RAW_STRING_LITERAL = _ts_kind("raw_string_literal")
+        _TS_WHERE_CLAUSE = _ts_kind("where_clause")
+        _TS_TYPE_PARAMETERS = _ts_kind("type_parameters")
+        _TS_LIFETIME_PARAMS = frozenset(
+            {_ts_kind("lifetime_parameter"), _ts_kind("lifetime")}
+        )
+        _TS_NAMED_PARAMS = frozenset(
+            {
+                _ts_kind("type_parameter"),
+                _ts_kind("const_parameter"),
+                _ts_kind("optional_type_parameter"),
+            }
+        )
+        _TS_CONSTRAINED_PARAM = _ts_kind("constrained_type_parameter")
+        _TS_TYPE_IDENTIFIER = _ts_kind("type_identifier")
+        _TS_PARAMETER = _ts_kind("parameter")
+        _TS_MUT_PATTERN = _ts_kind("mut_pattern")
+        _TS_IDENTIFIER = _ts_kind("identifier")
+        _TS_MUTABLE = _ts_kind("mutable_specifier")
+        _TS_REFERENCE_TYPE = _ts_kind("reference_type")
+        _TS_FUNCTION_MODIFIERS = _ts_kind("function_modifiers")
+        _TS_UNSAFE = _ts_kind("unsafe", False)
+        _TS_ASYNC = _ts_kind("async", False)
+        _TS_FIELD_LIST = _ts_kind("field_declaration_list")
+        _TS_FIELD = _ts_kind("field_declaration")
+        _TS_TUPLE_FIELD_LIST = _ts_kind("ordered_field_declaration_list")
+        _TS_ENUM_VARIANT = _ts_kind("enum_variant")
+        _TS_FUNCTION_ITEM = _ts_kind("function_item")
+        _TS_STRUCT_ITEM = _ts_kind("struct_item")
+        _TS_ENUM_ITEM = _ts_kind("enum_item")
+        _TS_TRAIT_ITEM = _ts_kind("trait_item")
+        _TS_USE_DECLARATION = _ts_kind("use_declaration")
+        _TS_CONST_ITEM = _ts_kind("const_item")
+        _TS_STATIC_ITEM = _ts_kind("static_item")
+        _TS_IMPL_ITEM = _ts_kind("impl_item")
+        _TS_MOD_ITEM = _ts_kind("mod_item")
+        _TS_MACRO_DEFINITION = _ts_kind("macro_definition")
+        _TS_MACRO_INVOCATION = _ts_kind("macro_invocation")
+        _TS_EXPRESSION_STATEMENT = _ts_kind("expression_statement")
+
+        # Nodes that attach to the item following them, like syn's outer attributes
+        _TS_ATTACHED = frozenset(
+            {_TS_ATTRIBUTE_ITEM, _ts_kind("line_comment"), _ts_kind("block_comment")}
+        )
+
+        # Functions with or without a body, as found in trait bodies
+        _TS_FUNCTIONS = frozenset(
+            {_TS_FUNCTION_ITEM, _ts_kind("function_signature_item")}
+        )
+    except Exception:
+        # tree-sitter and tree-sitter-rust built for mismatched ABIs; stay on syn
+        TREE_SITTER_RUST_AVAILABLE = False
+
+
+def _ts_text(node: Any) -> str:
+    """Return the source text of a tree-sitter node."""
+    return node.text.decode("utf-8")
+
+
+def _ts_is_pub(node: Any) -> bool:
+    """True for plain `pub` visibility, matching syn's Visibility::Public."""
+    for child in node.children:
+        if child.kind_id == _TS_VISIBILITY:
+            return _ts_text(child) == "pub"
+    return False
+
+
+def _ts_has_child(node: Any, kind_id: int) -> bool:
+    """True if any direct child has the given node kind."""
+    return any(child.kind_id == kind_id for child in node.children)
+
+
+def _ts_attached(node: Any, body: Optional[Any] = None) -> Tuple[int, str, List[str]]:
+    """Return the start line, doc string and attributes attached to an item.
+
+    Inner attributes at the top of `body` are appended, as syn folds a
+    function body's inner attributes into the function's own.
+    """
+    line = node.start_point[0] + 1
+    docs: List[str] = []
+    attributes: List[str] = []
+    sibling = node.prev_sibling
+    while sibling is not None and sibling.kind_id in _TS_ATTACHED:
+        if sibling.kind_id == _TS_ATTRIBUTE_ITEM:
+            attributes.append(_ts_text(sibling))
+            text = _ts_doc_attribute(sibling)
+            if text is not None:
+                docs.append(text)
+            line = sibling.start_point[0] + 1
+        elif _ts_has_child(sibling, _TS_OUTER_DOC_MARKER):
+            # Doc comments are #[doc] attributes to syn, so report them as both
+            text = _ts_doc_text(sibling)
+            docs.append(text)
+            attributes.append(f"#[doc = {json.dumps(text, ensure_ascii=False)}]")
+            line = sibling.start_point[0] + 1
+        sibling = sibling.prev_sibling
+    docs.reverse()
+    attributes.reverse()
+
+    for child in body.named_children if body is not None else ():
+        if child.kind_id == _TS_INNER_ATTRIBUTE_ITEM:
+            attributes.append(_ts_text(child))
+            text = _ts_doc_attribute(child)
+            if text is not None:
+                docs.append(text)
+        elif child.kind_id not in _TS_ATTACHED:
+            break
+        elif _ts_has_child(child, _TS_INNER_DOC_MARKER):
+            text = _ts_doc_text(child)
+            docs.append(text)
+            attributes.append(f"#![doc = {json.dumps(text, ensure_ascii=False)}]")
+    return line, "\n".join(docs), attributes
+
+
+def _ts_doc_text(comment: Any) -> str:
+    """Return the text of a doc comment, as syn reports it for #[doc]."""
+    doc = comment.child_by_field_name("doc")
+    return _ts_text(doc).rstrip("\r\n") if doc is not None else ""
+
+
+# Escapes in a Rust string literal; a backslash before a newline skips the
+# line break and the whitespace that follows it
+_RUST_ESCAPE = re.compile(
+    r"\\(?:u\{([0-9a-fA-F_]+)\}|x([0-7][0-9a-fA-F])|\r?\n[ \t\r\n]*|(.))", re.S
+)
+_RUST_SIMPLE_ESCAPES = {
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "0": "\0",
+    "\\": "\\",
+    "'": "'",
+    '"': '"',
 }
 
-fn main() {
-    let args: Vec<String> = env::args().collect();
-    if args.len() != 2 {
-        eprintln!("Usage: {} <filename>", args[0]);
-        std::process::exit(1);
-    }
 
-    let filename = &args[1];
-    let content = fs::read_to_string(filename).expect("Could not read file");
-    
-    let syntax = syn::parse_file(&content).expect("Unable to parse file");
-    
-    let mut result = serde_json::json!({
-        "functions": Vec::<FunctionInfo>::new(),
-        "structs": Vec::<StructInfo>::new(),
-        "enums": Vec::<EnumInfo>::new(),
-        "traits": Vec::<TraitInfo>::new(),
-        "imports": Vec::<ImportInfo>::new(),
-        "variables": Vec::<VariableInfo>::new(),
-        "impl_blocks": Vec::<ImplInfo>::new(),
-        "modules": Vec::<String>::new(),
-        "macros": Vec::<MacroInfo>::new(),
-        "unsafe_blocks": Vec::<usize>::new(),
-        "lifetimes": Vec::<String>::new(),
-        "crate_name": ""
-    });
-
-    for item in syntax.items {
-        match item {
-            Item::Fn(item_fn) => {
-                let func_info = extract_function_info(&item_fn);
-                result["functions"].as_array_mut().unwrap().push(serde_json::to_value(func_info).unwrap());
-            }
-            Item::Struct(item_struct) => {
-                let struct_info = extract_struct_info(&item_struct);
-                result["structs"].as_array_mut().unwrap().push(serde_json::to_value(struct_info).unwrap());
+def _rust_unescape(match: "re.Match[str]") -> str:
+    """Decode one escape sequence matched by _RUST_ESCAPE."""
+    code, byte, char = match.groups()
+    if code is not None:
+        return chr(int(code.replace("_", ""), 16))
+    if byte is not None:
+        return chr(int(byte, 16))
+    if char is not None:
+        return _RUST_SIMPLE_ESCAPES.get(char, match.group(0))
+    return ""
+
+
+def _ts_doc_attribute(item: Any) -> Optional[str]:
+    """Return the value of a #[doc = "..."] attribute item, or None for other attributes."""
+    attribute = item.named_children[0] if item.named_children else None
+    if attribute is None or not attribute.named_children:
+        return None
+    path = attribute.named_children[0]
+    value = attribute.child_by_field_name("value")
+    if path.kind_id != _TS_IDENTIFIER or _ts_text(path) != "doc" or value is None:
+        return None
+    text = _ts_text(value)
+    if value.kind_id == _TS_RAW_STRING_LITERAL:
+        hashes = len(text) - len(text[1:].lstrip("#")) - 1
+        return text[hashes + 2 : -(hashes + 1)]
+    if value.kind_id == _TS_STRING_LITERAL:
+        return _RUST_ESCAPE.sub(_rust_unescape, text[1:-1])
+    return None
+
+
+def _ts_generics(node: Any) -> Tuple[List[str], List[str], Optional[str]]:
+    """Split generic parameters into type/const names and lifetimes, plus the where clause."""
+    names: List[str] = []
+    lifetimes: List[str] = []
+    where_clause = None
+    for child in node.children:
+        if child.kind_id == _TS_WHERE_CLAUSE:
+            where_clause = _ts_text(child)
+        elif child.kind_id == _TS_TYPE_PARAMETERS:
+            for param in child.named_children:
+                if param.kind_id in _TS_LIFETIME_PARAMS:
+                    lifetime = param.child_by_field_name("name") or param
+                    lifetimes.append(_ts_text(lifetime))
+                elif param.kind_id in _TS_NAMED_PARAMS:
+                    names.append(_ts_text(param.child_by_field_name("name")))
+                elif param.kind_id == _TS_CONSTRAINED_PARAM:
+                    names.append(_ts_text(param.child_by_field_name("left")))
+                elif param.kind_id == _TS_TYPE_IDENTIFIER:
+                    names.append(_ts_text(param))
+    return names, lifetimes, where_clause
+
+
+def _ts_function(node: Any, is_exported: bool) -> Dict[str, Any]:
+    """Extract a function or method signature."""
+    line, doc, attributes = _ts_attached(node, node.child_by_field_name("body"))
+    generics, lifetimes, where_clause = _ts_generics(node)
+
+    parameters = []
+    params = node.child_by_field_name("parameters")
+    for param in params.named_children if params is not None else ():
+        pattern = param.child_by_field_name("pattern")
+        if param.kind_id != _TS_PARAMETER or pattern is None:
+            continue
+        if pattern.kind_id == _TS_MUT_PATTERN:
+            pattern = pattern.named_children[-1]
+        if pattern.kind_id != _TS_IDENTIFIER:
+            continue
+        param_type = param.child_by_field_name("type")
+        parameters.append(
+            {
+                "name": _ts_text(pattern),
+                "type_name": _ts_text(param_type),
+                "is_mut": _ts_has_child(param, _TS_MUTABLE),
+                "is_reference": param_type.kind_id == _TS_REFERENCE_TYPE,
+                "is_lifetime": False,
             }
-            Item::Enum(item_enum) => {
-                let enum_info = extract_enum_info(&item_enum);
-                result["enums"].as_array_mut().unwrap().push(serde_json::to_value(enum_info).unwrap());
-            }
-            Item::Trait(item_trait) => {
-                let trait_info = extract_trait_info(&item_trait);
-                result["traits"].as_array_mut().unwrap().push(serde_json::to_value(trait_info).unwrap());
-            }
-            Item::Use(item_use) => {
-                let import_info = extract_import_info(&item_use);
-                result["imports"].as_array_mut().unwrap().push(serde_json::to_value(import_info).unwrap());
-            }
-            Item::Const(item_const) => {
-                let var_info = extract_variable_info_const(&item_const);
-                result["variables"].as_array_mut().unwrap().push(serde_json::to_value(var_info).unwrap());
-            }
-            Item::Static(item_static) => {
-                let var_info = extract_variable_info_static(&item_static);
-                result["variables"].as_array_mut().unwrap().push(serde_json::to_value(var_info).unwrap());
-            }
-            Item::Impl(item_impl) => {
-                let impl_info = extract_impl_info(&item_impl);
-                result["impl_blocks"].as_array_mut().unwrap().push(serde_json::to_value(impl_info).unwrap());
-            }
-            Item::Mod(item_mod) => {
-                if let Some(ident) = item_mod.ident {
-                    result["modules"].as_array_mut().unwrap().push(serde_json::Value::String(ident.to_string()));
-                }
-            }
-            Item::Macro(item_macro) => {
-                let macro_info = extract_macro_info(&item_macro);
-                result["macros"].as_array_mut().unwrap().push(serde_json::to_value(macro_info).unwrap());
-            }
-            _ => {}
-        }
+        )
+
+    modifiers = next(
+        (child for child in node.children if child.kind_id == _TS_FUNCTION_MODIFIERS),
+        None,
+    )
+    return_type = node.child_by_field_name("return_type")
+    return {
+        "name": _ts_text(node.child_by_field_name("name")),
+        "parameters": parameters,
+        "return_type": _ts_text(return_type) if return_type is not None else "()",
+        "line": line,
+        "is_exported": is_exported,
+        "is_unsafe": modifiers is not None and _ts_has_child(modifiers, _TS_UNSAFE),
+        "is_async": modifiers is not None and _ts_has_child(modifiers, _TS_ASYNC),
+        "generics": generics,
+        "lifetimes": lifetimes,
+        "where_clause": where_clause,
+        "doc": doc,
+        "attributes": attributes,
     }
 
-    println!("{}", serde_json::to_string_pretty(&result).unwrap());
-}
 
-fn extract_function_info(item_fn: &ItemFn) -> FunctionInfo {
-    let sig = &item_fn.sig;
-    let mut parameters = Vec::new();
-    
-    for input in &sig.inputs {
-        if let syn::FnArg::Typed(pat_type) = input {
-            if let syn::Pat::Ident(pat_ident) = &*pat_type.pat {
-                let param_info = ParamInfo {
-                    name: pat_ident.ident.to_string(),
-                    type_name: quote!(#pat_type.ty).to_string(),
-                    is_mut: pat_ident.mutability.is_some(),
-                    is_reference: matches!(&*pat_type.ty, syn::Type::Reference(_)),
-                    is_lifetime: false,
-                };
-                parameters.push(param_info);
-            }
-        }
-    }
-
-    let mut generics = Vec::new();
-    let mut lifetimes = Vec::new();
-    
-    for param in &sig.generics.params {
-        match param {
-            syn::GenericParam::Type(type_param) => {
-                generics.push(type_param.ident.to_string());
-            }
-            syn::GenericParam::Lifetime(lifetime_def) => {
-                lifetimes.push(lifetime_def.lifetime.to_string());
-            }
-            syn::GenericParam::Const(const_param) => {
-                generics.push(const_param.ident.to_string());
-            }
-        }
+def _ts_fields(body: Optional[Any]) -> List[Dict[str, Any]]:
+    """Extract named or tuple fields from a struct or enum variant body."""
+    if body is None:
+        return []
+    fields = []
+    if body.kind_id == _TS_FIELD_LIST:
+        for field in body.named_children:
+            if field.kind_id == _TS_FIELD:
+                fields.append(
+                    {
+                        "name": _ts_text(field.child_by_field_name("name")),
+                        "type_name": _ts_text(field.child_by_field_name("type")),
+                        "is_pub": _ts_is_pub(field),
+                        "is_mut": False,
+                    }
+                )
+    else:
+        # Tuple fields: an optional visibility precedes each type
+        is_pub = False
+        for child in body.named_children:
+            if child.kind_id == _TS_VISIBILITY:
+                is_pub = _ts_text(child) == "pub"
+            elif child.kind_id not in _TS_ATTACHED:
+                fields.append(
+                    {
+                        "name": str(len(fields)),
+                        "type_name": _ts_text(child),
+                        "is_pub": is_pub,
+                        "is_mut": False,
+                    }
+                )
+                is_pub = False
+    return fields
+
+
+def _ts_struct(node: Any) -> Dict[str, Any]:
+    """Extract a struct declaration."""
+    line, doc, attributes = _ts_attached(node)
+    generics, lifetimes, where_clause = _ts_generics(node)
+    body = node.child_by_field_name("body")
+    return {
+        "name": _ts_text(node.child_by_field_name("name")),
+        "fields": _ts_fields(body),
+        "line": line,
+        "is_exported": _ts_is_pub(node),
+        "generics": generics,
+        "lifetimes": lifetimes,
+        "where_clause": where_clause,
+        "doc": doc,
+        "attributes": attributes,
+        "is_tuple": body is not None and body.kind_id == _TS_TUPLE_FIELD_LIST,
     }
 
-    FunctionInfo {
-        name: sig.ident.to_string(),
-        parameters,
-        return_type: match &sig.output {
-            syn::ReturnType::Default => "()".to_string(),
-            syn::ReturnType::Type(_, ty) => quote!(#ty).to_string(),
-        },
-        line: item_fn.span().start().line,
-        is_exported: item_fn.vis == syn::Visibility::Public(crate::Token![pub](item_fn.span())),
-        is_unsafe: sig.unsafety.is_some(),
-        is_async: sig.asyncness.is_some(),
-        generics,
-        lifetimes,
-        where_clause: sig.generics.where_clause.as_ref().map(|w| quote!(#w).to_string()),
-        doc: extract_doc(&item_fn.attrs),
-        attributes: extract_attributes(&item_fn.attrs),
-    }
-}
 
-fn extract_struct_info(item_struct: &ItemStruct) -> StructInfo {
-    let mut fields = Vec::new();
-    let mut generics = Vec::new();
-    let mut lifetimes = Vec::new();
-    
-    for param in &item_struct.generics.params {
-        match param {
-            syn::GenericParam::Type(type_param) => {
-                generics.push(type_param.ident.to_string());
-            }
-            syn::GenericParam::Lifetime(lifetime_def) => {
-                lifetimes.push(lifetime_def.lifetime.to_string());
+def _ts_enum(node: Any) -> Dict[str, Any]:
+    """Extract an enum declaration and its variants."""
+    line, doc, attributes = _ts_attached(node)
+    generics, lifetimes, where_clause = _ts_generics(node)
+    variants = []
+    for variant in node.child_by_field_name("body").named_children:
+        if variant.kind_id != _TS_ENUM_VARIANT:
+            continue
+        body = variant.child_by_field_name("body")
+        variants.append(
+            {
+                "name": _ts_text(variant.child_by_field_name("name")),
+                "fields": _ts_fields(body),
+                "is_tuple": body is not None and body.kind_id == _TS_TUPLE_FIELD_LIST,
+                "is_unit": body is None,
             }
-            syn::GenericParam::Const(const_param) => {
-                generics.push(const_param.ident.to_string());
-            }
-        }
+        )
+    return {
+        "name": _ts_text(node.child_by_field_name("name")),
+        "variants": variants,
+        "line": line,
+        "is_exported": _ts_is_pub(node),
+        "generics": generics,
+        "lifetimes": lifetimes,
+        "where_clause": where_clause,
+        "doc": doc,
+        "attributes": attributes,
     }
 
-    let is_tuple = matches!(item_struct.fields, syn::Fields::Unnamed(_));
-    
-    match &item_struct.fields {
-        syn::Fields::Named(fields_named) => {
-            for field in &fields_named.named {
-                if let Some(ident) = &field.ident {
-                    let field_info = FieldInfo {
-                        name: ident.to_string(),
-                        type_name: quote!(#field.ty).to_string(),
-                        is_pub: field.vis == syn::Visibility::Public(crate::Token![pub](field.span())),
-                        is_mut: false,
-                    };
-                    fields.push(field_info);
-                }
-            }
-        }
-        syn::Fields::Unnamed(fields_unnamed) => {
-            for (index, field) in fields_unnamed.unnamed.iter().enumerate() {
-                let field_info = FieldInfo {
-                    name: format!("{}", index),
-                    type_name: quote!(#field.ty).to_string(),
-                    is_pub: field.vis == syn::Visibility::Public(crate::Token![pub](field.span())),
-                    is_mut: false,
-                };
-                fields.push(field_info);
-            }
-        }
-        syn::Fields::Unit => {}
-    }
 
-    StructInfo {
-        name: item_struct.ident.to_string(),
-        fields,
-        line: item_struct.span().start().line,
-        is_exported: item_struct.vis == syn::Visibility::Public(crate::Token![pub](item_struct.span())),
-        generics,
-        lifetimes,
-        where_clause: item_struct.generics.where_clause.as_ref().map(|w| quote!(#w).to_string()),
-        doc: extract_doc(&item_struct.attrs),
-        attributes: extract_attributes(&item_struct.attrs),
-        is_tuple,
+def _ts_trait(node: Any) -> Dict[str, Any]:
+    """Extract a trait declaration and its method signatures."""
+    line, doc, attributes = _ts_attached(node)
+    generics, lifetimes, where_clause = _ts_generics(node)
+    bounds = node.child_by_field_name("bounds")
+    return {
+        "name": _ts_text(node.child_by_field_name("name")),
+        # Trait methods are public by default
+        "methods": [
+            _ts_function(item, True)
+            for item in node.child_by_field_name("body").named_children
+            if item.kind_id in _TS_FUNCTIONS
+        ],
+        "line": line,
+        "is_exported": _ts_is_pub(node),
+        "generics": generics,
+        "lifetimes": lifetimes,
+        "where_clause": where_clause,
+        "supertraits": (
+            [_ts_text(bound) for bound in bounds.named_children]
+            if bounds is not None
+            else []
+        ),
+        "doc": doc,
+        "attributes": attributes,
     }
-}
 
-fn extract_enum_info(item_enum: &ItemEnum) -> EnumInfo {
-    let mut variants = Vec::new();
-    let mut generics = Vec::new();
-    let mut lifetimes = Vec::new();
-    
-    for param in &item_enum.generics.params {
-        match param {
-            syn::GenericParam::Type(type_param) => {
-                generics.push(type_param.ident.to_string());
-            }
-            syn::GenericParam::Lifetime(lifetime_def) => {
-                lifetimes.push(lifetime_def.lifetime.to_string());
-            }
-            syn::GenericParam::Const(const_param) => {
-                generics.push(const_param.ident.to_string());
-            }
-        }
-    }
 
-    for variant in &item_enum.variants {
-        let mut variant_fields = Vec::new();
-        let is_tuple = matches!(variant.fields, syn::Fields::Unnamed(_));
-        let is_unit = matches!(variant.fields, syn::Fields::Unit);
-        
-        match &variant.fields {
-            syn::Fields::Named(fields_named) => {
-                for field in &fields_named.named {
-                    if let Some(ident) = &field.ident {
-                        let field_info = FieldInfo {
-                            name: ident.to_string(),
-                            type_name: quote!(#field.ty).to_string(),
-                            is_pub: field.vis == syn::Visibility::Public(crate::Token![pub](field.span())),
-                            is_mut: false,
-                        };
-                        variant_fields.push(field_info);
-                    }
-                }
-            }
-            syn::Fields::Unnamed(fields_unnamed) => {
-                for (index, field) in fields_unnamed.unnamed.iter().enumerate() {
-                    let field_info = FieldInfo {
-                        name: format!("{}", index),
-                        type_name: quote!(#field.ty).to_string(),
-                        is_pub: field.vis == syn::Visibility::Public(crate::Token![pub](field.span())),
-                        is_mut: false,
-                    };
-                    variant_fields.push(field_info);
-                }
-            }
-            syn::Fields::Unit => {}
-        }
-        
-        let variant_info = VariantInfo {
-            name: variant.ident.to_string(),
-            fields: variant_fields,
-            is_tuple,
-            is_unit,
-        };
-        variants.push(variant_info);
+def _ts_impl(node: Any) -> Dict[str, Any]:
+    """Extract an impl block and its methods."""
+    line, _, _ = _ts_attached(node)
+    generics, lifetimes, where_clause = _ts_generics(node)
+    trait = node.child_by_field_name("trait")
+    body = node.child_by_field_name("body")
+    return {
+        "target_type": _ts_text(node.child_by_field_name("type")),
+        "trait_name": _ts_text(trait) if trait is not None else None,
+        "methods": [
+            _ts_function(item, _ts_is_pub(item))
+            for item in (body.named_children if body is not None else ())
+            if item.kind_id == _TS_FUNCTION_ITEM
+        ],
+        "line": line,
+        "is_unsafe": _ts_has_child(node, _TS_UNSAFE),
+        "generics": generics,
+        "lifetimes": lifetimes,
+        "where_clause": where_clause,
     }
 
-    EnumInfo {
-        name: item_enum.ident.to_string(),
-        variants,
-        line: item_enum.span().start().line,
-        is_exported: item_enum.vis == syn::Visibility::Public(crate::Token![pub](item_enum.span())),
-        generics,
-        lifetimes,
-        where_clause: item_enum.generics.where_clause.as_ref().map(|w| quote!(#w).to_string()),
-        doc: extract_doc(&item_enum.attrs),
-        attributes: extract_attributes(&item_enum.attrs),
-    }
-}
 
-fn extract_trait_info(item_trait: &ItemTrait) -> TraitInfo {
-    let mut methods = Vec::new();
-    let mut generics = Vec::new();
-    let mut lifetimes = Vec::new();
-    let mut supertraits = Vec::new();
-    
-    for param in &item_trait.generics.params {
-        match param {
-            syn::GenericParam::Type(type_param) => {
-                generics.push(type_param.ident.to_string());
-            }
-            syn::GenericParam::Lifetime(lifetime_def) => {
-                lifetimes.push(lifetime_def.lifetime.to_string());
-            }
-            syn::GenericParam::Const(const_param) => {
-                generics.push(const_param.ident.to_string());
-            }
-        }
+def _ts_variable(node: Any, is_const: bool) -> Dict[str, Any]:
+    """Extract a const or static item."""
+    line, doc, attributes = _ts_attached(node)
+    value = node.child_by_field_name("value")
+    return {
+        "name": _ts_text(node.child_by_field_name("name")),
+        "type_name": _ts_text(node.child_by_field_name("type")),
+        "value": _ts_text(value) if value is not None else None,
+        "line": line,
+        "is_exported": _ts_is_pub(node),
+        "is_const": is_const,
+        "is_static": not is_const,
+        "doc": doc,
+        "attributes": attributes,
     }
 
-    for bound in &item_trait.supertraits {
-        supertraits.push(quote!(#bound).to_string());
-    }
 
-    for item in &item_trait.items {
-        if let syn::TraitItem::Fn(method) = item {
-            let func_info = extract_function_info_from_trait_method(method);
-            methods.push(func_info);
-        }
+def _ts_import(node: Any) -> Dict[str, Any]:
+    """Extract a use declaration."""
+    line, _, attributes = _ts_attached(node)
+    # syn keeps a leading `::` out of the use tree
+    path = _ts_text(node.child_by_field_name("argument")).removeprefix("::").lstrip()
+    return {
+        "path": path,
+        "name": None,
+        "alias": None,
+        "line": line,
+        "is_glob": "*" in path,
+        "attributes": attributes,
     }
 
-    TraitInfo {
-        name: item_trait.ident.to_string(),
-        methods,
-        line: item_trait.span().start().line,
-        is_exported: item_trait.vis == syn::Visibility::Public(crate::Token![pub](item_trait.span())),
-        generics,
-        lifetimes,
-        where_clause: item_trait.generics.where_clause.as_ref().map(|w| quote!(#w).to_string()),
-        supertraits,
-        doc: extract_doc(&item_trait.attrs),
-        attributes: extract_attributes(&item_trait.attrs),
-    }
-}
 
-fn extract_function_info_from_trait_method(method: &syn::TraitItemFn) -> FunctionInfo {
-    let sig = &method.sig;
-    let mut parameters = Vec::new();
-    
-    for input in &sig.inputs {
-        if let syn::FnArg::Typed(pat_type) = input {
-            if let syn::Pat::Ident(pat_ident) = &*pat_type.pat {
-                let param_info = ParamInfo {
-                    name: pat_ident.ident.to_string(),
-                    type_name: quote!(#pat_type.ty).to_string(),
-                    is_mut: pat_ident.mutability.is_some(),
-                    is_reference: matches!(&*pat_type.ty, syn::Type::Reference(_)),
-                    is_lifetime: false,
-                };
-                parameters.push(param_info);
-            }
-        }
+def _ts_macro(node: Any, name: str) -> Dict[str, Any]:
+    """Extract a macro definition or item-position macro call."""
+    line, _, attributes = _ts_attached(node)
+    return {
+        "name": name,
+        "content": _ts_text(node),
+        "line": line,
+        "is_exported": any(
+            re.match(r"#\s*\[\s*macro_export\b", attr) for attr in attributes
+        ),
     }
 
-    let mut generics = Vec::new();
-    let mut lifetimes = Vec::new();
-    
-    for param in &sig.generics.params {
-        match param {
-            syn::GenericParam::Type(type_param) => {
-                generics.push(type_param.ident.to_string());
-            }
-            syn::GenericParam::Lifetime(lifetime_def) => {
-                lifetimes.push(lifetime_def.lifetime.to_string());
-            }
-            syn::GenericParam::Const(const_param) => {
-                generics.push(const_param.ident.to_string());
-            }
-        }
-    }
 
-    FunctionInfo {
-        name: sig.ident.to_string(),
-        parameters,
-        return_type: match &sig.output {
-            syn::ReturnType::Default => "()".to_string(),
-            syn::ReturnType::Type(_, ty) => quote!(#ty).to_string(),
-        },
-        line: method.span().start().line,
-        is_exported: true, // Trait methods are public by default
-        is_unsafe: sig.unsafety.is_some(),
-        is_async: sig.asyncness.is_some(),
-        generics,
-        lifetimes,
-        where_clause: sig.generics.where_clause.as_ref().map(|w| quote!(#w).to_string()),
-        doc: extract_doc(&method.attrs),
-        attributes: extract_attributes(&method.attrs),
+def _ts_extract(root: Any) -> Dict[str, Any]:
+    """Build the same top-level item summary the syn parser emits."""
+    result: Dict[str, Any] = {
+        "functions": [],
+        "structs": [],
+        "enums": [],
+        "traits": [],
+        "imports": [],
+        "variables": [],
+        "impl_blocks": [],
+        "modules": [],
+        "macros": [],
+        "unsafe_blocks": [],
+        "lifetimes": [],
+        "crate_name": "",
     }
-}
+    for node in root.named_children:
+        kind = node.kind_id
+        if kind == _TS_FUNCTION_ITEM:
+            result["functions"].append(_ts_function(node, _ts_is_pub(node)))
+        elif kind == _TS_STRUCT_ITEM:
+            result["structs"].append(_ts_struct(node))
+        elif kind == _TS_ENUM_ITEM:
+            result["enums"].append(_ts_enum(node))
+        elif kind == _TS_TRAIT_ITEM:
+            result["traits"].append(_ts_trait(node))
+        elif kind == _TS_USE_DECLARATION:
+            result["imports"].append(_ts_import(node))
+        elif kind == _TS_CONST_ITEM:
+            result["variables"].append(_ts_variable(node, True))
+        elif kind == _TS_STATIC_ITEM:
+            result["variables"].append(_ts_variable(node, False))
+        elif kind == _TS_IMPL_ITEM:
+            result["impl_blocks"].append(_ts_impl(node))
+        elif kind == _TS_MOD_ITEM:
+            result["modules"].append(_ts_text(node.child_by_field_name("name")))
+        elif kind == _TS_MACRO_DEFINITION:
+            name = _ts_text(node.child_by_field_name("name"))
+            result["macros"].append(_ts_macro(node, name))
+        elif kind == _TS_EXPRESSION_STATEMENT and node.named_children:
+            # Item-position macro calls such as `lazy_static! { ... }`
+            call = node.named_children[0]
+            if call.kind_id == _TS_MACRO_INVOCATION:
+                name = _ts_text(call.child_by_field_name("macro"))
+                result["macros"].append(_ts_macro(node, name))
+        elif kind == _TS_MACRO_INVOCATION:
+            name = _ts_text(node.child_by_field_name("macro"))
+            result["macros"].append(_ts_macro(node, name))
+    return result
+
+
+def _build_import(import_data: Dict[str, Any]) -> Import:
+    """Build an Import from one parsed use declaration."""
+    path = import_data["path"]
+    return Import(
+        module=sys.intern(path),
+        name=import_data["name"],
+        alias=import_data["alias"],
+        line_number=import_data["line"],
+        import_type="use",
+        is_relative=path.startswith(("crate::", "super::")),
+        is_standard_library=_is_std_crate(path.partition("::")[0]),
+    )
 
-fn extract_import_info(item_use: &ItemUse) -> ImportInfo {
-    let path = quote!(#item_use.tree).to_string();
-    let is_glob = path.contains("*");
-    
-    ImportInfo {
-        path,
-        name: None,
-        alias: None,
-        line: item_use.span().start().line,
-        is_glob,
-        attributes: extract_attributes(&item_use.attrs),
-    }
-}
 
-fn extract_variable_info_const(item_const: &ItemConst) -> VariableInfo {
-    VariableInfo {
-        name: item_const.ident.to_string(),
-        type_name: quote!(#item_const.ty).to_string(),
-        value: Some(quote!(#item_const.expr).to_string()),
-        line: item_const.span().start().line,
-        is_exported: item_const.vis == syn::Visibility::Public(crate::Token![pub](item_const.span())),
-        is_const: true,
-        is_static: false,
-        doc: extract_doc(&item_const.attrs),
-        attributes: extract_attributes(&item_const.attrs),
-    }
-}
+class RustParser(BaseParser):
+    """Rust language parser using syn crate."""
 
-fn extract_variable_info_static(item_static: &ItemStatic) -> VariableInfo {
-    VariableInfo {
-        name: item_static.ident.to_string(),
-        type_name: quote!(#item_static.ty).to_string(),
-        value: Some(quote!(#item_static.expr).to_string()),
-        line: item_static.span().start().line,
-        is_exported: item_static.vis == syn::Visibility::Public(crate::Token![pub](item_static.span())),
-        is_const: false,
-        is_static: true,
-        doc: extract_doc(&item_static.attrs),
-        attributes: extract_attributes(&item_static.attrs),
-    }
-}
+    # Parser binary shared by every instance, resolved lazily on first parse
+    _binary: Optional[str] = None
+    # Why the binary could not be found or built, so cargo is not re-run per parse
+    _binary_error: Optional[str] = None
+    _binary_lock = threading.Lock()
+    # tree-sitter parsers are not thread-safe, so each worker thread gets its own
+    _ts_local = threading.local()
 
-fn extract_impl_info(item_impl: &ItemImpl) -> ImplInfo {
-    let target_type = quote!(#item_impl.self_ty).to_string();
-    let trait_name = item_impl.trait_.as_ref().map(|(_, path, _)| quote!(#path).to_string());
-    let mut methods = Vec::new();
-    let mut generics = Vec::new();
-    let mut lifetimes = Vec::new();
-    
-    for param in &item_impl.generics.params {
-        match param {
-            syn::GenericParam::Type(type_param) => {
-                generics.push(type_param.ident.to_string());
-            }
-            syn::GenericParam::Lifetime(lifetime_def) => {
-                lifetimes.push(lifetime_def.lifetime.to_string());
-            }
-            syn::GenericParam::Const(const_param) => {
-                generics.push(const_param.ident.to_string());
-            }
-        }
-    }
+    def __init__(self):
+        super().__init__()
+        self.language = Language.RUST
+        self.cache_path: Optional[Path] = _AST_CACHE_DB  # None disables disk cache
+        self.max_disk_cache_entries = 10000
+        self._disk_cache_pruned = False
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._cache_db_lock = threading.Lock()
+        # In-process LRU of parser output keyed by content hash
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_memory_cache_entries = 256
+        self._inflight: Dict[str, asyncio.Lock] = {}
+        # Last tree-sitter tree and source per file, reused for incremental re-parses
+        self._trees: "OrderedDict[str, Tuple[Any, bytes]]" = OrderedDict()
+        self.max_cached_trees = 512
+        self._trees_lock = threading.Lock()
+        # Long-lived parser process serving length-prefixed requests over pipes
+        self._daemon: Optional[subprocess.Popen] = None
+        self._daemon_lock = threading.Lock()
+        self.daemon_timeout = 60  # Seconds to wait for each daemon reply
+        # Parse in-process with tree-sitter when installed, keeping syn as fallback
+        self.use_tree_sitter = TREE_SITTER_RUST_AVAILABLE
 
-    for item in &item_impl.items {
-        if let syn::ImplItem::Fn(method) = item {
-            let func_info = extract_function_info_from_impl_method(method);
-            methods.push(func_info);
-        }
-    }
+    def get_supported_extensions(self) -> List[str]:
+        """Return list of supported file extensions."""
+        return [".rs"]
 
-    ImplInfo {
-        target_type,
-        trait_name,
-        methods,
-        line: item_impl.span().start().line,
-        is_unsafe: item_impl.unsafety.is_some(),
-        generics,
-        lifetimes,
-        where_clause: item_impl.generics.where_clause.as_ref().map(|w| quote!(#w).to_string()),
-    }
-}
+    async def parse_file(self, file_path: str, content: str) -> ASTResult:
+        """Parse Rust file and extract AST information."""
+        start_time = time.time()
 
-fn extract_function_info_from_impl_method(method: &syn::ImplItemFn) -> FunctionInfo {
-    let sig = &method.sig;
-    let mut parameters = Vec::new();
-    
-    for input in &sig.inputs {
-        if let syn::FnArg::Typed(pat_type) = input {
-            if let syn::Pat::Ident(pat_ident) = &*pat_type.pat {
-                let param_info = ParamInfo {
-                    name: pat_ident.ident.to_string(),
-                    type_name: quote!(#pat_type.ty).to_string(),
-                    is_mut: pat_ident.mutability.is_some(),
-                    is_reference: matches!(&*pat_type.ty, syn::Type::Reference(_)),
-                    is_lifetime: false,
-                };
-                parameters.push(param_info);
-            }
-        }
-    }
+        try:
+            # Use syn via the prebuilt Rust parser, skipping it for cached content
+            ast_data = await self._get_ast_data(file_path, content)
+            return self._build_result(ast_data, start_time)
 
-    let mut generics = Vec::new();
-    let mut lifetimes = Vec::new();
-    
-    for param in &sig.generics.params {
-        match param {
-            syn::GenericParam::Type(type_param) => {
-                generics.push(type_param.ident.to_string());
-            }
-            syn::GenericParam::Lifetime(lifetime_def) => {
-                lifetimes.push(lifetime_def.lifetime.to_string());
-            }
-            syn::GenericParam::Const(const_param) => {
-                generics.push(const_param.ident.to_string());
-            }
+        except Exception as e:
+            return self._error_result(str(e), start_time)
+
+    def _build_result(self, ast_data: Dict[str, Any], start_time: float) -> ASTResult:
+        """Convert parser output to an ASTResult."""
+        functions = self._convert_functions(ast_data["functions"])
+        classes = self._convert_structs(ast_data["structs"])
+        classes.extend(self._convert_traits(ast_data["traits"]))
+        classes.extend(self._convert_enums(ast_data["enums"]))
+        imports = self._convert_imports(ast_data["imports"])
+        variables = self._convert_variables(ast_data["variables"])
+
+        parse_time = int((time.time() - start_time) * 1000)
+
+        return ASTResult(
+            success=True,
+            language=self.language,
+            functions=functions,
+            classes=classes,
+            imports=imports,
+            variables=variables,
+            # ast_data may be a cache entry shared with later parses, so
+            # results get their own copies of anything mutable
+            metadata={
+                "crate_name": ast_data["crate_name"],
+                "modules": list(ast_data["modules"]),
+                "macros": copy.deepcopy(ast_data["macros"]),
+                "traits": copy.deepcopy(ast_data["traits"]),
+                "impl_blocks": copy.deepcopy(ast_data["impl_blocks"]),
+                "unsafe_blocks": list(ast_data["unsafe_blocks"]),
+                "lifetimes": list(ast_data["lifetimes"]),
+            },
+            parse_time_ms=parse_time,
+        )
+
+    def _error_result(self, error: str, start_time: float) -> ASTResult:
+        """Build a failed ASTResult."""
+        return ASTResult(
+            success=False,
+            language=self.language,
+            error=error,
+            parse_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+    async def parse_batch(self, file_paths: List[str]) -> List[ASTResult]:
+        """Parse multiple files, sending every cache miss to one parser run."""
+        start_time = time.time()
+        sources: Dict[str, str] = {}
+        read_errors: Dict[str, str] = {}
+        # Read every file concurrently in worker threads, off the event loop
+        reads = await asyncio.gather(
+            *(
+                asyncio.to_thread(_read_source, path)
+                for path in dict.fromkeys(file_paths)
+            )
+        )
+        for file_path, content, error in reads:
+            if error is None:
+                sources[file_path] = content
+            else:
+                read_errors[file_path] = error
+
+        hashes = {
+            path: hashlib.sha256(content.encode("utf-8")).hexdigest()
+            for path, content in sources.items()
         }
-    }
+        ast_by_hash: Dict[str, Dict[str, Any]] = {}
+        misses: Dict[str, Tuple[str, str]] = {}
+        for path, content_hash in hashes.items():
+            ast_data = self._memory_cache.get(content_hash)
+            if ast_data is None:
+                misses[content_hash] = (path, sources[path])
+            else:
+                self._memory_cache.move_to_end(content_hash)
+                ast_by_hash[content_hash] = ast_data
+
+        if misses and self.use_tree_sitter:
+            # In-process parsing needs no batching; each file takes the usual path
+            return await asyncio.gather(
+                *(
+                    self._parse_or_error(path, sources.get(path), read_errors)
+                    for path in file_paths
+                )
+            )
 
-    FunctionInfo {
-        name: sig.ident.to_string(),
-        parameters,
-        return_type: match &sig.output {
-            syn::ReturnType::Default => "()".to_string(),
-            syn::ReturnType::Type(_, ty) => quote!(#ty).to_string(),
-        },
-        line: method.span().start().line,
-        is_exported: method.vis == syn::Visibility::Public(crate::Token![pub](method.span())),
-        is_unsafe: sig.unsafety.is_some(),
-        is_async: sig.asyncness.is_some(),
-        generics,
-        lifetimes,
-        where_clause: sig.generics.where_clause.as_ref().map(|w| quote!(#w).to_string()),
-        doc: extract_doc(&method.attrs),
-        attributes: extract_attributes(&method.attrs),
-    }
-}
+        if misses:
+            try:
+                parsed = await asyncio.to_thread(self._extract_rust_ast_batch, misses)
+            except Exception:
+                # Batch mode unavailable; parse the files one at a time instead
+                return await asyncio.gather(
+                    *(
+                        self._parse_or_error(path, sources.get(path), read_errors)
+                        for path in file_paths
+                    )
+                )
+            for content_hash, ast_data in parsed.items():
+                if "error" not in ast_data:
+                    self._remember_ast(content_hash, ast_data)
+            ast_by_hash.update(parsed)
 
-fn extract_macro_info(item_macro: &syn::ItemMacro) -> MacroInfo {
-    let name = if let Some(ident) = &item_macro.ident {
-        ident.to_string()
-    } else {
-        "macro_rules".to_string()
-    };
-    
-    MacroInfo {
-        name,
-        content: quote!(#item_macro.mac).to_string(),
-        line: item_macro.span().start().line,
-        is_exported: item_macro.vis == syn::Visibility::Public(crate::Token![pub](item_macro.span())),
-    }
-}
+        results = []
+        for file_path in file_paths:
+            if file_path in read_errors:
+                results.append(self._error_result(read_errors[file_path], start_time))
+                continue
+            ast_data = ast_by_hash[hashes[file_path]]
+            if "error" in ast_data:
+                results.append(
+                    self._error_result(
+                        f"Rust parser failed: {ast_data['error']}", start_time
+                    )
+                )
+                continue
+            try:
+                results.append(self._build_result(ast_data, start_time))
+            except Exception as e:
+                results.append(self._error_result(str(e), start_time))
+        return results
+
+    async def _parse_or_error(
+        self, file_path: str, content: Optional[str], read_errors: Dict[str, str]
+    ) -> ASTResult:
+        """Parse one file from a batch, or report why it could not be read."""
+        if content is None:
+            return self._error_result(read_errors[file_path], time.time())
+        return await self.parse_file(file_path, content)
+
+    async def _get_ast_data(self, file_path: str, content: str) -> Dict[str, Any]:
+        """Get parser output from memory, disk, or the parser, in that order."""
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+        ast_data = self._memory_cache.get(content_hash)
+        if ast_data is not None:
+            self._memory_cache.move_to_end(content_hash)
+            return ast_data
+
+        # Concurrent requests for the same content share one parser run
+        lock = self._inflight.setdefault(content_hash, asyncio.Lock())
+        try:
+            async with lock:
+                ast_data = self._memory_cache.get(content_hash)
+                if ast_data is None and self.use_tree_sitter:
+                    ast_data = await asyncio.to_thread(
+                        self._extract_rust_ast_tree_sitter, file_path, content
+                    )
+                if ast_data is None:
+                    ast_data = await asyncio.to_thread(
+                        self._extract_rust_ast_cached, file_path, content, content_hash
+                    )
+                self._remember_ast(content_hash, ast_data)
+        finally:
+            if not lock.locked():
+                self._inflight.pop(content_hash, None)
+
+        return ast_data
+
+    def _get_ts_parser(self) -> Any:
+        """Return this thread's tree-sitter parser, creating it on first use."""
+        parser = getattr(self._ts_local, "parser", None)
+        if parser is None:
+            parser = tree_sitter.Parser(_TS_LANGUAGE)
+            self._ts_local.parser = parser
+        return parser
+
+    def _extract_rust_ast_tree_sitter(
+        self, file_path: str, content: str
+    ) -> Optional[Dict[str, Any]]:
+        """Extract declarations with tree-sitter, or None if the source has errors."""
+        source = content.encode("utf-8")
+        with self._trees_lock:
+            # Taken out of the LRU so no other thread edits the same tree
+            previous = self._trees.pop(file_path, None)
+
+        parser = self._get_ts_parser()
+        if previous is None:
+            tree = parser.parse(source)
+        else:
+            old_tree, old_source = previous
+            self._edit_tree(old_tree, old_source, source)
+            tree = parser.parse(source, old_tree)
+
+        with self._trees_lock:
+            self._trees[file_path] = (tree, source)
+            if len(self._trees) > self.max_cached_trees:
+                self._trees.popitem(last=False)
+
+        if tree.root_node.has_error:
+            # Leave error recovery and its diagnostics to syn
+            return None
+        return _ts_extract(tree.root_node)
+
+    @staticmethod
+    def _edit_tree(tree: Any, old_source: bytes, new_source: bytes) -> None:
+        """Describe the changed span between two sources to a tree as one edit."""
+        start = _common_prefix_length(old_source, new_source)
+        # Shared suffix, not overlapping the shared prefix in either source
+        limit = min(len(old_source), len(new_source)) - start
+        suffix = _common_prefix_length(
+            old_source[len(old_source) - limit :][::-1],
+            new_source[len(new_source) - limit :][::-1],
+        )
+        old_end = len(old_source) - suffix
+        new_end = len(new_source) - suffix
+        tree.edit(
+            start_byte=start,
+            old_end_byte=old_end,
+            new_end_byte=new_end,
+            start_point=_point_at(new_source, start),
+            old_end_point=_point_at(old_source, old_end),
+            new_end_point=_point_at(new_source, new_end),
+        )
+
+    def _remember_ast(self, content_hash: str, ast_data: Dict[str, Any]) -> None:
+        """Add parser output to the in-process LRU, evicting the oldest entry."""
+        self._memory_cache[content_hash] = ast_data
+        self._memory_cache.move_to_end(content_hash)
+        if len(self._memory_cache) > self.max_memory_cache_entries:
+            self._memory_cache.popitem(last=False)
+
+    def _extract_rust_ast_cached(
+        self, file_path: str, content: str, content_hash: str
+    ) -> Dict[str, Any]:
+        """Extract AST information, reusing on-disk results for identical content."""
+        ast_data = self._load_cached_ast(content_hash)
+        if ast_data is None:
+            ast_data = self._extract_rust_ast(file_path, content)
+            self._store_cached_ast(content_hash, ast_data)
+
+        return ast_data
+
+    def _extract_rust_ast_batch(
+        self, sources: Dict[str, Tuple[str, str]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Extract ASTs keyed by content hash, parsing disk cache misses in one run."""
+        results: Dict[str, Dict[str, Any]] = {}
+        batch = []
+        for content_hash, (path, content) in sources.items():
+            ast_data = self._load_cached_ast(content_hash)
+            if ast_data is None:
+                batch.append((content_hash, path, content))
+            else:
+                results[content_hash] = ast_data
+        if not batch:
+            return results
+
+        payload = _json_dumps(
+            [{"path": path, "content": content} for _, path, content in batch]
+        )
+        try:
+            result = subprocess.run(
+                [self._get_parser_binary(), "--batch"],
+                input=payload,
+                capture_output=True,
+                timeout=60 * len(batch),
+            )
+        except subprocess.TimeoutExpired:
+            raise Exception("Rust parser timed out")
 
-fn extract_doc(attrs: &[Attribute]) -> String {
-    let mut doc_lines = Vec::new();
-    for attr in attrs {
-        if attr.path().is_ident("doc") {
-            if let Ok(meta) = attr.meta.require_name_value() {
-                if let syn::Expr::Lit(syn::ExprLit { lit: syn::Lit::Str(lit_str), .. }) = &meta.value {
-                    doc_lines.push(lit_str.value());
-                }
-            }
-        }
-    }
-    doc_lines.join("\\n")
-}
+        if result.returncode != 0:
+            raise Exception(
+                f"Rust parser failed: {result.stderr.decode('utf-8', 'replace')}"
+            )
 
-fn extract_attributes(attrs: &[Attribute]) -> Vec<String> {
-    attrs.iter().map(|attr| quote!(#attr).to_string()).collect()
-}
-"""
-
-        # Create Cargo.toml for the parser
-        cargo_toml = """
-[package]
-name = "rust_ast_parser"
-version = "0.1.0"
-edition = "2021"
-
-[dependencies]
-syn = { version = "2.0", features = ["full", "extra-traits"] }
-quote = "1.0"
-serde = { version = "1.0", features = ["derive"] }
-serde_json = "1.0"
-"""
-
-        # Create temporary directory for Rust project
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Write Cargo.toml
-            with open(os.path.join(temp_dir, "Cargo.toml"), "w") as f:
-                f.write(cargo_toml)
-
-            # Create src directory
-            src_dir = os.path.join(temp_dir, "src")
-            os.makedirs(src_dir)
-
-            # Write main.rs
-            with open(os.path.join(src_dir, "main.rs"), "w") as f:
-                f.write(rust_parser_code)
-
-            # Write the target Rust file
-            target_file = os.path.join(src_dir, "target.rs")
-            with open(target_file, "w") as f:
-                f.write(content)
+        # Results come back in request order
+        for (content_hash, _, _), entry in zip(batch, _json_loads(result.stdout)):
+            if "error" in entry:
+                results[content_hash] = {"error": entry["error"]}
+            else:
+                results[content_hash] = entry["ast"]
+                self._store_cached_ast(content_hash, entry["ast"])
+        return results
+
+    def _get_cache_db(self) -> Optional[sqlite3.Connection]:
+        """Open the on-disk cache on first use; None if disabled or unavailable."""
+        # Entries can't be versioned without the parser source, so skip caching
+        if _parser_version() is None:
+            return None
+        if self._cache_db is None and self.cache_path is not None:
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(
+                    self.cache_path,
+                    timeout=5,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS ast_cache ("
+                    "hash BLOB PRIMARY KEY, version TEXT NOT NULL, "
+                    "payload BLOB NOT NULL, used_at REAL NOT NULL)"
+                )
+            except (OSError, sqlite3.Error):
+                self.cache_path = None
+                return None
+            self._cache_db = db
+        return self._cache_db
+
+    def _load_cached_ast(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Load cached parser output, or None on a miss or stale entry."""
+        key = bytes.fromhex(content_hash)
+        with self._cache_db_lock:
+            db = self._get_cache_db()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT payload FROM ast_cache WHERE hash = ? AND version = ?",
+                    (key, _parser_version()),
+                ).fetchone()
+                if row is None:
+                    return None
+                # Touch the entry so pruning evicts least recently used ones
+                db.execute(
+                    "UPDATE ast_cache SET used_at = ? WHERE hash = ?",
+                    (time.time(), key),
+                )
+            except sqlite3.Error:
+                return None
 
+        try:
+            return _json_loads(row[0])
+        except ValueError:
+            return None
+
+    def _store_cached_ast(self, content_hash: str, ast_data: Dict[str, Any]) -> None:
+        """Write parser output to the on-disk cache."""
+        with self._cache_db_lock:
+            db = self._get_cache_db()
+            if db is None:
+                return
             try:
-                # Run the Rust parser
-                result = subprocess.run(
-                    ["cargo", "run", "--bin", "rust_ast_parser", target_file],
-                    cwd=temp_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
+                db.execute(
+                    "INSERT OR REPLACE INTO ast_cache VALUES (?, ?, ?, ?)",
+                    (
+                        bytes.fromhex(content_hash),
+                        _parser_version(),
+                        _json_dumps(ast_data),
+                        time.time(),
+                    ),
                 )
+                if not self._disk_cache_pruned:
+                    self._disk_cache_pruned = True
+                    self._prune_disk_cache(db)
+            except sqlite3.Error:
+                return
+
+    def _prune_disk_cache(self, db: sqlite3.Connection) -> None:
+        """Drop stale entries and evict least recently used ones beyond the limit."""
+        db.execute("DELETE FROM ast_cache WHERE version != ?", (_parser_version(),))
+        db.execute(
+            "DELETE FROM ast_cache WHERE hash IN ("
+            "SELECT hash FROM ast_cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_cache_entries,),
+        )
 
-                if result.returncode == 0:
-                    return json.loads(result.stdout)
-                else:
-                    raise Exception(f"Rust parser failed: {result.stderr}")
+    def _extract_rust_ast(self, file_path: str, content: str) -> Dict[str, Any]:
+        """Extract AST information using Rust's syn crate."""
+        try:
+            ast_data = self._request_daemon(content)
+        except (OSError, ValueError, struct.error):
+            # Daemon died, hung or spoke garbage; fall back to a one-shot process
+            return self._extract_rust_ast_oneshot(file_path, content)
+
+        if "error" in ast_data:
+            raise Exception(f"Rust parser failed: {ast_data['error']}")
+        return ast_data
+
+    def _request_daemon(self, content: str) -> Dict[str, Any]:
+        """Send one source file to the parser daemon and read back its JSON."""
+        payload = content.encode("utf-8")
+        with self._daemon_lock:
+            daemon = self._get_daemon()
+            try:
+                daemon.stdin.write(struct.pack("<I", len(payload)) + payload)
+                daemon.stdin.flush()
+                deadline = time.monotonic() + self.daemon_timeout
+                (size,) = struct.unpack("<I", _read_pipe(daemon.stdout, 4, deadline))
+                return _json_loads(_read_pipe(daemon.stdout, size, deadline))
+            except (OSError, ValueError, struct.error):
+                # The reply stream can't be trusted any more; the next request respawns
+                self._stop_daemon(kill=True)
+                raise
+
+    def _get_daemon(self) -> subprocess.Popen:
+        """Return the running parser daemon, starting it if needed."""
+        if self._daemon is None or self._daemon.poll() is not None:
+            self._daemon = subprocess.Popen(
+                [self._get_parser_binary(), "--daemon"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._daemon
+
+    def _stop_daemon(self, kill: bool = False) -> None:
+        """Stop the parser daemon, killing it outright if asked; callers hold _daemon_lock."""
+        daemon, self._daemon = self._daemon, None
+        if daemon is None:
+            return
+        if not kill:
+            try:
+                daemon.stdin.close()
+                daemon.wait(timeout=5)
+                return
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        daemon.kill()
+        daemon.wait()
+
+    def close(self) -> None:
+        """Stop the parser daemon and close the disk cache; both reopen on next use."""
+        with self._cache_db_lock:
+            db, self._cache_db = self._cache_db, None
+        if db is not None:
+            db.close()
+        with self._daemon_lock:
+            self._stop_daemon()
+
+    async def __aenter__(self) -> "RustParser":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _extract_rust_ast_oneshot(self, file_path: str, content: str) -> Dict[str, Any]:
+        """Extract AST information by running the parser once for this file."""
+        try:
+            # Hand the source to the prebuilt Rust parser over stdin
+            result = subprocess.run(
+                [self._get_parser_binary(), "--stdin"],
+                input=content.encode("utf-8"),
+                capture_output=True,
+                timeout=60,
+            )
+        except subprocess.TimeoutExpired:
+            raise Exception("Rust parser timed out")
 
-            except subprocess.TimeoutExpired:
-                raise Exception("Rust parser timed out")
+        if result.returncode != 0:
+            raise Exception(
+                f"Rust parser failed: {result.stderr.decode('utf-8', 'replace')}"
+            )
+        return _json_loads(result.stdout)
+
+    @classmethod
+    def _get_parser_binary(cls) -> str:
+        """Return the prebuilt parser binary, building it on first use."""
+        with cls._binary_lock:
+            if cls._binary is None:
+                if cls._binary_error is not None:
+                    raise Exception(cls._binary_error)
+                try:
+                    cls._binary = cls._locate_parser_binary()
+                except Exception as e:
+                    cls._binary_error = str(e)
+                    raise
+            return cls._binary
+
+    @staticmethod
+    def _locate_parser_binary() -> str:
+        """Find the parser binary via env var, PATH, or the reactor install root."""
+        override = os.environ.get("REACTOR_RUST_AST_PARSER")
+        if override:
+            return override
+
+        on_path = shutil.which(_PARSER_BINARY_NAME)
+        if on_path:
+            return on_path
+
+        installed = _PARSER_INSTALL_ROOT / "bin" / _PARSER_BINARY_NAME
+        version = _parser_version()
+        if version is None:
+            # No crate source to build from; use whatever binary is installed
+            if installed.exists():
+                return str(installed)
+            raise Exception("Rust parser source is missing from this install")
+
+        stamp = installed.with_name(f"{_PARSER_BINARY_NAME}.version")
+        # Rebuild when the embedded parser source changed since the last install
+        if not installed.exists() or not (
+            stamp.exists() and stamp.read_text().strip() == version
+        ):
+            RustParser._install_parser_binary()
+            stamp.write_text(version)
+        return str(installed)
+
+    @staticmethod
+    def _install_parser_binary() -> None:
+        """Compile the parser crate once with cargo install."""
+        try:
+            result = subprocess.run(
+                [
+                    "cargo",
+                    "install",
+                    "--path",
+                    str(_RUST_CRATE_DIR),
+                    "--root",
+                    str(_PARSER_INSTALL_ROOT),
+                    # Keep build artifacts out of the package directory
+                    "--target-dir",
+                    str(_PARSER_INSTALL_ROOT / "build" / "rust-ast-parser"),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=600,
+            )
+        except subprocess.TimeoutExpired:
+            raise Exception("Building the Rust parser timed out")
+
+        if result.returncode != 0:
+            raise Exception(f"Building the Rust parser failed: {result.stderr}")
+
+    def _convert_parameters(self, params_data: List[Dict]) -> List[Parameter]:
+        """Convert parameter data to Parameter objects."""
+        return [
+            Parameter(
+                name=param_data["name"],
+                # Type names repeat heavily across a crate, so results share
+                # one interned copy; mostly-unique docs and attributes are not
+                type_hint=sys.intern(param_data["type_name"]),
+                default_value=None,
+                is_optional=False,
+                docstring=None,
+            )
+            for param_data in params_data
+        ]
 
     def _convert_functions(self, functions_data: List[Dict]) -> List[Function]:
         """Convert function data to Function objects."""
-        functions = []
-        for func_data in functions_data:
-            parameters = []
-            for param_data in func_data.get("parameters", []):
-                parameters.append(
-                    Parameter(
-                        name=param_data["name"],
-                        type_hint=param_data["type_name"],
-                        default_value=None,
-                        is_optional=False,
-                        docstring=None,
-                    )
-                )
-
-            functions.append(
-                Function(
-                    name=func_data["name"],
-                    parameters=parameters,
-                    return_type=func_data["return_type"],
-                    decorators=func_data.get("attributes", []),
-                    docstring=func_data.get("doc", ""),
-                    line_number=func_data["line"],
-                    complexity_score=1,
-                    is_async=func_data.get("is_async", False),
-                    is_method=False,
-                    class_name=None,
-                )
+        return [
+            Function(
+                name=func_data["name"],
+                parameters=self._convert_parameters(func_data["parameters"]),
+                return_type=sys.intern(func_data["return_type"]),
+                decorators=list(func_data["attributes"]),
+                docstring=func_data["doc"],
+                line_number=func_data["line"],
+                complexity_score=1,
+                is_async=func_data["is_async"],
+                is_method=False,
+                class_name=None,
             )
-
-        return functions
+            for func_data in functions_data
+        ]
 
     def _convert_structs(self, structs_data: List[Dict]) -> List[Class]:
         """Convert struct data to Class objects."""
-        classes = []
-        for struct_data in structs_data:
-            properties = []
-            for field_data in struct_data.get("fields", []):
-                properties.append(
+        return [
+            Class(
+                name=struct_data["name"],
+                base_classes=[],
+                methods=[],
+                properties=[
                     Property(
                         name=field_data["name"],
-                        type_hint=field_data["type_name"],
+                        type_hint=sys.intern(field_data["type_name"]),
                         line_number=struct_data["line"],
                         default_value=None,
-                        access_level=(
-                            "public" if field_data.get("is_pub", False) else "private"
-                        ),
+                        access_level="public" if field_data["is_pub"] else "private",
                         docstring=None,
                         is_property=True,
                     )
-                )
-
-            classes.append(
-                Class(
-                    name=struct_data["name"],
-                    base_classes=[],
-                    methods=[],
-                    properties=properties,
-                    decorators=struct_data.get("attributes", []),
-                    docstring=struct_data.get("doc", ""),
-                    line_number=struct_data["line"],
-                    is_abstract=False,
-                    access_level=(
-                        "public" if struct_data.get("is_exported", False) else "private"
-                    ),
-                )
+                    for field_data in struct_data["fields"]
+                ],
+                decorators=list(struct_data["attributes"]),
+                docstring=struct_data["doc"],
+                line_number=struct_data["line"],
+                is_abstract=False,
+                access_level="public" if struct_data["is_exported"] else "private",
             )
-
-        return classes
+            for struct_data in structs_data
+        ]
 
     def _convert_traits(self, traits_data: List[Dict]) -> List[Class]:
         """Convert trait data to Class objects."""
-        classes = []
-        for trait_data in traits_data:
-            methods = []
-            for method_data in trait_data.get("methods", []):
-                parameters = []
-                for param_data in method_data.get("parameters", []):
-                    parameters.append(
-                        Parameter(
-                            name=param_data["name"],
-                            type_hint=param_data["type_name"],
-                            default_value=None,
-                            is_optional=False,
-                            docstring=None,
-                        )
-                    )
-
-                methods.append(
+        return [
+            Class(
+                name=trait_data["name"],
+                base_classes=[sys.intern(bound) for bound in trait_data["supertraits"]],
+                methods=[
                     Method(
                         name=method_data["name"],
-                        parameters=parameters,
-                        return_type=method_data["return_type"],
-                        decorators=method_data.get("attributes", []),
-                        docstring=method_data.get("doc", ""),
+                        parameters=self._convert_parameters(method_data["parameters"]),
+                        return_type=sys.intern(method_data["return_type"]),
+                        decorators=list(method_data["attributes"]),
+                        docstring=method_data["doc"],
                         line_number=method_data["line"],
                         access_level="public",
                         is_static=False,
-                        is_async=method_data.get("is_async", False),
+                        is_async=method_data["is_async"],
                     )
-                )
-
-            classes.append(
-                Class(
-                    name=trait_data["name"],
-                    base_classes=trait_data.get("supertraits", []),
-                    methods=methods,
-                    properties=[],
-                    decorators=trait_data.get("attributes", []),
-                    docstring=trait_data.get("doc", ""),
-                    line_number=trait_data["line"],
-                    is_abstract=True,
-                    access_level=(
-                        "public" if trait_data.get("is_exported", False) else "private"
-                    ),
-                )
+                    for method_data in trait_data["methods"]
+                ],
+                properties=[],
+                decorators=list(trait_data["attributes"]),
+                docstring=trait_data["doc"],
+                line_number=trait_data["line"],
+                is_abstract=True,
+                access_level="public" if trait_data["is_exported"] else "private",
             )
-
-        return classes
+            for trait_data in traits_data
+        ]
 
     def _convert_enums(self, enums_data: List[Dict]) -> List[Class]:
         """Convert enum data to Class objects."""
-        classes = []
-        for enum_data in enums_data:
-            # Convert enum variants to methods for representation
-            methods = []
-            for variant_data in enum_data.get("variants", []):
-                methods.append(
+        return [
+            Class(
+                name=enum_data["name"],
+                base_classes=[],
+                # Enum variants are represented as static methods
+                methods=[
                     Method(
                         name=variant_data["name"],
                         parameters=[],
@@ -969,104 +1341,39 @@ serde_json = "1.0"
                         is_static=True,
                         is_async=False,
                     )
-                )
-
-            classes.append(
-                Class(
-                    name=enum_data["name"],
-                    base_classes=[],
-                    methods=methods,
-                    properties=[],
-                    decorators=enum_data.get("attributes", []),
-                    docstring=enum_data.get("doc", ""),
-                    line_number=enum_data["line"],
-                    is_abstract=False,
-                    access_level=(
-                        "public" if enum_data.get("is_exported", False) else "private"
-                    ),
-                )
+                    for variant_data in enum_data["variants"]
+                ],
+                properties=[],
+                decorators=list(enum_data["attributes"]),
+                docstring=enum_data["doc"],
+                line_number=enum_data["line"],
+                is_abstract=False,
+                access_level="public" if enum_data["is_exported"] else "private",
             )
-
-        return classes
+            for enum_data in enums_data
+        ]
 
     def _convert_imports(self, imports_data: List[Dict]) -> List[Import]:
         """Convert import data to Import objects."""
-        imports = []
-        for import_data in imports_data:
-            imports.append(
-                Import(
-                    module=import_data["path"],
-                    name=import_data.get("name", ""),
-                    alias=import_data.get("alias", ""),
-                    line_number=import_data["line"],
-                    import_type="use",
-                    is_relative=import_data["path"].starts_with("crate::")
-                    or import_data["path"].starts_with("super::"),
-                    is_standard_library=self._is_standard_library(import_data["path"]),
-                )
-            )
-
-        return imports
+        return [_build_import(import_data) for import_data in imports_data]
 
     def _convert_variables(self, variables_data: List[Dict]) -> List[Variable]:
         """Convert variable data to Variable objects."""
-        variables = []
-        for var_data in variables_data:
-            variables.append(
-                Variable(
-                    name=var_data["name"],
-                    type_hint=var_data["type_name"],
-                    default_value=var_data.get("value", ""),
-                    line_number=var_data["line"],
-                    is_global=True,
-                    is_constant=var_data.get("is_const", False),
-                )
+        return [
+            Variable(
+                name=var_data["name"],
+                type_hint=sys.intern(var_data["type_name"]),
+                default_value=var_data["value"],
+                line_number=var_data["line"],
+                is_global=True,
+                is_constant=var_data["is_const"],
             )
-
-        return variables
+            for var_data in variables_data
+        ]
 
     def _is_standard_library(self, import_path: str) -> bool:
         """Check if import is from Rust standard library."""
-        std_crates = {
-            "std",
-            "core",
-            "alloc",
-            "proc_macro",
-            "test",
-            "vec",
-            "string",
-            "collections",
-            "hash_map",
-            "hash_set",
-            "option",
-            "result",
-            "cell",
-            "rc",
-            "sync",
-            "arc",
-            "box",
-            "iter",
-            "slice",
-            "str",
-            "char",
-            "num",
-            "io",
-            "fs",
-            "path",
-            "env",
-            "process",
-            "thread",
-            "time",
-            "net",
-            "os",
-            "ffi",
-            "fmt",
-            "error",
-        }
-
-        # Check if it starts with std::, core::, or is a direct std crate
-        parts = import_path.split("::")
-        return parts[0] in std_crates
+        return _is_std_crate(import_path.partition("::")[0])
 
     def extract_functions(self, ast_root: Any) -> List[Function]:
         """Extract function definitions from AST."""
@@ -0,0 +1,217 @@
+"""
+tests/test_python_parser.py
+
+Tests for the Python AST parser.
+"""
+
+import ast
+import asyncio
+
+import pytest
+
+from src.ast.parsers.python_parser import PythonParser
+
+
+def test_deeply_nested_expression():
+    """Long expression chains parse without exhausting the recursion limit"""
+    content = "x = " + " + ".join(["1"] * 2500) + "\n"
+
+    result = asyncio.run(PythonParser().parse_file("deep.py", content))
+
+    assert result.success, result.error
+    assert [v.name for v in result.variables] == ["x"]
+
+
+def test_scopes_close_after_nested_definitions():
+    """Methods get their class, and assignments after a class are module-level"""
+    content = (
+        "class A:\n"
+        "    def f(self):\n"
+        "        y = 1\n"
+        "        def g():\n"
+        "            pass\n"
+        "z = 2\n"
+    )
+
+    result = asyncio.run(PythonParser().parse_file("scopes.py", content))
+
+    assert result.success, result.error
+    assert [(f.name, f.class_name) for f in result.functions] == [
+        ("f", "A"),
+        ("g", None),
+    ]
+    assert [v.name for v in result.variables] == ["z"]
+
+
+def test_parse_batch_recovers_from_dead_worker(tmp_path):
+    """A killed pool worker does not break later batches"""
+    path = tmp_path / "mod.py"
+    path.write_text("def f():\n    return 1\n")
+    parser = PythonParser()
+    try:
+        assert asyncio.run(parser.parse_batch([str(path)]))[0].success
+
+        for process in list(PythonParser._pool._processes.values()):
+            process.kill()
+            process.join()
+
+        for _ in range(2):
+            results = asyncio.run(parser.parse_batch([str(path)]))
+            assert results[0].success, results[0].error
+    finally:
+        parser.close()
+
+
+def test_annotations_and_defaults_are_unparsed():
+    """Annotations and defaults are rendered as source by ast.unparse"""
+    content = (
+        "def f(a, /, b: Dict[str, int] = None, x=(1, 2), *args: a | b,"
+        " **kw: 'Bar') -> Optional['Foo']:\n"
+        "    pass\n"
+        "def g(y: 'Foo', z=1):\n"
+        "    pass\n"
+    )
+
+    result = asyncio.run(PythonParser().parse_file("hints.py", content))
+
+    assert result.success, result.error
+    f, g = result.functions
+    assert [(p.name, p.type_hint, p.default_value) for p in f.parameters] == [
+        ("b", "Dict[str, int]", "None"),
+        ("x", "", "(1, 2)"),
+        ("*args", "a | b", None),
+        ("**kw", "Bar", None),
+    ]
+    assert f.return_type == "Optional['Foo']"
+    assert [(p.type_hint, p.default_value) for p in g.parameters] == [
+        ("Foo", None),
+        ("", "1"),
+    ]
+
+
+def test_complexity_excludes_nested_scopes():
+    """Branches in nested functions, lambdas and classes don't count for the outer function"""
+    content = (
+        "def outer(x):\n"
+        "    if x:\n"
+        "        pass\n"
+        "    def inner(y):\n"
+        "        if y:\n"
+        "            pass\n"
+        "        for i in y:\n"
+        "            pass\n"
+        "    key = lambda z: z.a and z.b or z.c\n"
+        "    class Local:\n"
+        "        def method(self):\n"
+        "            while self:\n"
+        "                pass\n"
+        "    return x\n"
+    )
+
+    result = asyncio.run(PythonParser().parse_file("nested.py", content))
+
+    assert result.success, result.error
+    assert {f.name: f.complexity_score for f in result.functions} == {
+        "outer": 2,
+        "inner": 3,
+        "method": 2,
+    }
+
+
+def test_close_keeps_pool_for_other_parsers(tmp_path):
+    """The shared pool outlives every parser but the last one to close"""
+    path = tmp_path / "mod.py"
+    path.write_text("x = 1\n")
+    first, second = PythonParser(), PythonParser()
+    try:
+        assert asyncio.run(first.parse_batch([str(path)]))[0].success
+        assert asyncio.run(second.parse_batch([str(path)]))[0].success
+        pool = PythonParser._pool
+
+        first.close()
+        first.close()
+        assert PythonParser._pool is pool
+        assert asyncio.run(second.parse_batch([str(path)]))[0].success
+        assert PythonParser._pool is pool
+    finally:
+        first.close()
+        second.close()
+    assert PythonParser._pool is None
+
+
+def test_keep_tree(tmp_path):
+    """parse_file returns the tree unless told not to; parse_batch only when asked"""
+    content = "def f():\n    return 1\n"
+    path = tmp_path / "mod.py"
+    path.write_text(content)
+    parser = PythonParser()
+    try:
+        kept = asyncio.run(parser.parse_file("mod.py", content))
+        dropped = asyncio.run(parser.parse_file("mod.py", content, keep_tree=False))
+        assert isinstance(kept.ast_root, ast.Module)
+        assert dropped.ast_root is None
+
+        assert asyncio.run(parser.parse_batch([str(path)]))[0].ast_root is None
+        (result,) = asyncio.run(parser.parse_batch([str(path)], keep_tree=True))
+        # The tree survives the round trip from the worker process
+        assert isinstance(result.ast_root, ast.Module)
+        assert ast.unparse(result.ast_root) == ast.unparse(ast.parse(content))
+    finally:
+        parser.close()
+
+
+def test_missing_docstrings_are_none():
+    """Definitions without a docstring report None; present ones are cleaned"""
+    content = (
+        "def bare():\n"
+        "    return 1\n"
+        "def documented():\n"
+        '    """Does things.\n'
+        "\n"
+        '    In detail."""\n'
+        "class Plain:\n"
+        "    def method(self):\n"
+        "        x = 'not a docstring'\n"
+        "class Described:\n"
+        "    '''A class.'''\n"
+    )
+
+    result = asyncio.run(PythonParser().parse_file("docs.py", content))
+
+    assert result.success, result.error
+    docs = {f.name: f.docstring for f in result.functions}
+    assert docs == {
+        "bare": None,
+        "documented": "Does things.\n\nIn detail.",
+        "method": None,
+    }
+    assert {c.name: c.docstring for c in result.classes} == {
+        "Plain": None,
+        "Described": "A class.",
+    }
+    assert result.classes[0].methods[0].docstring is None
+
+
+@pytest.mark.parametrize(
+    "content", ["", "  \n\t\n", "# header\n\n    # indented comment\n"]
+)
+def test_blank_source_skips_parsing(content):
+    """Empty, whitespace-only and comment-only files give an empty result"""
+    result = asyncio.run(PythonParser().parse_file("__init__.py", content))
+
+    assert result.success
+    assert result.functions == []
+    assert result.classes == []
+    assert result.imports == []
+    assert result.variables == []
+    assert result.metadata["node_count"] == 1
+
+
+@pytest.mark.parametrize("content", ['"""Package docs."""\n', "# comment\npass\n"])
+def test_minimal_source_is_parsed(content):
+    """A docstring or a bare pass is real code and goes through ast.parse"""
+    result = asyncio.run(PythonParser().parse_file("__init__.py", content))
+
+    assert result.success
+    assert result.metadata["node_count"] > 1
+    assert isinstance(result.ast_root.body[0], (ast.Expr, ast.Pass))
@@ -0,0 +1,503 @@
+"""
+tests/test_rust_parser.py
+
+Tests for the Rust AST parser.
+"""
+
+import asyncio
+import json
+import os
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.ast.parsers import rust_parser
+from src.ast.parsers.rust_parser import RustParser
+
+
+FIXTURE = """\
+//! Crate docs
+#![allow(dead_code)]
+
+use std::collections::HashMap;
+use ::std::fmt;
+use crate::model::{Node, Edge as E};
+pub use super::util::*;
+
+/// Maximum depth, with "quotes" and a \\ backslash
+#[allow(clippy::all)]
+pub const MAX_DEPTH: usize = 1 << 4;
+static NAMES: [&str; 2] = ["a", "b"];
+
+#[doc = "Adjacency \\"graph\\""]
+#[doc = r#"over "nodes""#]
+#[derive(Debug, Clone)]
+#[serde(rename_all = "camelCase")]
+pub struct Graph<'a, T: Clone>
+where
+    T: Default,
+{
+    /// Nodes by name
+    pub nodes: HashMap<&'a str, T>,
+    edges: Vec<(usize, usize)>,
+}
+
+pub trait Visit: Clone + Send + 'static {
+    fn visit(&self, node: &Node) -> Option<usize>;
+}
+
+impl<'a, T: Clone + Default> std::fmt::Display for Graph<'a, T> {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        write!(f, "graph")
+    }
+}
+
+/// Walks the graph
+#[inline]
+pub async fn walk<F>(graph: &Graph<'_, u8>, mut f: F) -> Vec<usize>
+where
+    F: FnMut(usize),
+{
+    #![allow(unused_mut)]
+    //! Inner docs
+    vec![]
+}
+
+#[macro_export]
+macro_rules! node {
+    ($name:expr) => { Node::new($name) };
+}
+
+lazy_static! {
+    static ref CACHE: HashMap<u8, u8> = HashMap::new();
+}
+
+thread_local!(static DEPTH: usize = 0);
+"""
+
+
+def _syn_binary():
+    """Return an already built syn parser binary, or None"""
+    for candidate in (
+        os.environ.get("REACTOR_RUST_AST_PARSER"),
+        shutil.which(rust_parser._PARSER_BINARY_NAME),
+    ):
+        if candidate:
+            return candidate
+    installed = (
+        rust_parser._PARSER_INSTALL_ROOT / "bin" / rust_parser._PARSER_BINARY_NAME
+    )
+    stamp = installed.with_name(f"{rust_parser._PARSER_BINARY_NAME}.version")
+    # A stale install would be rebuilt on first use; don't build from a test
+    if stamp.exists() and stamp.read_text().strip() == rust_parser._parser_version():
+        return str(installed)
+    return None
+
+
+@pytest.fixture
+def syn_binary(monkeypatch):
+    """Path to the syn parser binary, shared by every RustParser"""
+    binary = _syn_binary()
+    if binary is None:
+        pytest.skip("Rust parser binary is not built")
+    monkeypatch.setattr(RustParser, "_binary", binary)
+    return binary
+
+
+@pytest.fixture
+def tree_sitter_available():
+    """Skip unless the optional tree-sitter backend is installed"""
+    if not rust_parser.TREE_SITTER_RUST_AVAILABLE:
+        pytest.skip("tree-sitter-rust is not installed")
+
+
+@pytest.fixture(params=["syn", "tree_sitter"])
+def backend(request):
+    """A RustParser without disk cache, on each parsing backend"""
+    parser = RustParser()
+    parser.cache_path = None
+    if request.param == "syn":
+        request.getfixturevalue("syn_binary")
+        parser.use_tree_sitter = False
+    else:
+        request.getfixturevalue("tree_sitter_available")
+    yield parser
+    parser.close()
+
+
+def test_backends_agree(syn_binary, tree_sitter_available):
+    """tree-sitter reports every item exactly as the syn parser does"""
+    result = subprocess.run(
+        [syn_binary, "--stdin"], input=FIXTURE.encode("utf-8"), capture_output=True
+    )
+    assert result.returncode == 0, result.stderr
+
+    tree = RustParser()._get_ts_parser().parse(FIXTURE.encode("utf-8"))
+    assert rust_parser._ts_extract(tree.root_node) == json.loads(result.stdout)
+
+
+def test_source_text_fields(backend):
+    """Paths, values, attributes and macros are reported as written"""
+    result = asyncio.run(backend.parse_file("lib.rs", FIXTURE))
+    assert result.success, result.error
+
+    assert [i.module for i in result.imports] == [
+        "std::collections::HashMap",
+        "std::fmt",
+        "crate::model::{Node, Edge as E}",
+        "super::util::*",
+    ]
+    assert [v.default_value for v in result.variables] == ["1 << 4", '["a", "b"]']
+    assert [m["name"] for m in result.metadata["macros"]] == [
+        "node",
+        "lazy_static",
+        "thread_local",
+    ]
+    assert result.metadata["macros"][2]["content"] == (
+        "thread_local!(static DEPTH: usize = 0);"
+    )
+    graph = next(c for c in result.classes if c.name == "Graph")
+    assert graph.docstring == 'Adjacency "graph"\nover "nodes"'
+    walk = result.functions[0]
+    assert walk.decorators == [
+        '#[doc = " Walks the graph"]',
+        "#[inline]",
+        "#![allow(unused_mut)]",
+        '#![doc = " Inner docs"]',
+    ]
+
+
+def test_mutating_a_result_leaves_the_cache_alone(backend):
+    """Results built from the memory cache don't share its lists and dicts"""
+    first = asyncio.run(backend.parse_file("lib.rs", FIXTURE))
+    first.functions[0].decorators.append("#[cold]")
+    first.classes[0].decorators.clear()
+    first.metadata["macros"][0]["name"] = "changed"
+    first.metadata["impl_blocks"][0]["methods"].clear()
+    first.metadata["modules"].append("extra")
+
+    second = asyncio.run(backend.parse_file("lib.rs", FIXTURE))
+
+    assert "#[cold]" not in second.functions[0].decorators
+    assert second.classes[0].decorators
+    assert second.metadata["macros"][0]["name"] == "node"
+    assert second.metadata["impl_blocks"][0]["methods"]
+    assert second.metadata["modules"] == []
+
+
+def test_import_classification(backend):
+    """Standard library and crate-relative imports are recognised"""
+    result = asyncio.run(backend.parse_file("lib.rs", FIXTURE))
+    assert result.success, result.error
+
+    assert [(i.is_standard_library, i.is_relative) for i in result.imports] == [
+        (True, False),
+        (True, False),
+        (False, True),
+        (False, True),
+    ]
+
+
+def test_common_prefix_length():
+    assert rust_parser._common_prefix_length(b"", b"abc") == 0
+    assert rust_parser._common_prefix_length(b"abc", b"abc") == 3
+    assert rust_parser._common_prefix_length(b"abcdef", b"abcxef") == 3
+    assert rust_parser._common_prefix_length(b"abc", b"abcdef") == 3
+    assert rust_parser._common_prefix_length(b"xbc", b"abc") == 0
+
+
+def test_point_at():
+    source = b"fn a() {}\n\nstruct B;\n"
+    assert rust_parser._point_at(source, 0) == (0, 0)
+    assert rust_parser._point_at(source, 3) == (0, 3)
+    assert rust_parser._point_at(source, 10) == (1, 0)
+    assert rust_parser._point_at(source, 11) == (2, 0)
+    assert rust_parser._point_at(source, 17) == (2, 6)
+
+
+def test_incremental_parse_matches_fresh_parse(tree_sitter_available):
+    """Re-parsing an edited file from its old tree gives the same result as from scratch"""
+    rng = random.Random(0)
+    parser = RustParser()
+    fresh = RustParser()._get_ts_parser()
+    content = FIXTURE
+    parser._extract_rust_ast_tree_sitter("lib.rs", content)
+
+    for _ in range(200):
+        # Replace a random span with a random snippet of the fixture
+        start = rng.randrange(len(content))
+        end = min(len(content), start + rng.randrange(20))
+        snippet_start = rng.randrange(len(FIXTURE))
+        snippet = FIXTURE[snippet_start : snippet_start + rng.randrange(20)]
+        content = content[:start] + snippet + content[end:]
+
+        ast_data = parser._extract_rust_ast_tree_sitter("lib.rs", content)
+        tree = fresh.parse(content.encode("utf-8"))
+        if tree.root_node.has_error:
+            # Error recovery may legitimately differ between the two parses
+            assert ast_data is None
+        else:
+            assert str(parser._trees["lib.rs"][0].root_node) == str(tree.root_node)
+            assert ast_data == rust_parser._ts_extract(tree.root_node)
+
+
+STUB_PARSER = """\
+import json, struct, sys, time
+
+# Stands in for the syn parser: reports the source as its only module name,
+# fails on sources reading "broken", and as a daemon dies on "crash" and
+# never answers "hang"
+mode = sys.argv[1]
+with open(LOG, "a") as log:
+    log.write(mode + "\\n")
+
+
+def parse(content):
+    if content == "broken":
+        return {"error": "expected item"}
+    return {
+        "functions": [], "structs": [], "enums": [], "traits": [], "imports": [],
+        "variables": [], "impl_blocks": [], "modules": [content], "macros": [],
+        "unsafe_blocks": [], "lifetimes": [], "crate_name": "",
+    }
+
+
+if mode == "--stdin":
+    sys.stdout.write(json.dumps(parse(sys.stdin.read())))
+elif mode == "--batch":
+    results = []
+    for source in json.load(sys.stdin):
+        ast = parse(source["content"])
+        entry = {"path": source["path"]}
+        entry.update({"error": ast["error"]} if "error" in ast else {"ast": ast})
+        results.append(entry)
+    sys.stdout.write(json.dumps(results))
+elif mode == "--daemon":
+    while True:
+        header = sys.stdin.buffer.read(4)
+        if len(header) < 4:
+            break
+        content = sys.stdin.buffer.read(struct.unpack("<I", header)[0]).decode()
+        if content == "crash":
+            sys.exit(1)
+        if content == "hang":
+            time.sleep(3600)
+        body = json.dumps(parse(content)).encode()
+        sys.stdout.buffer.write(struct.pack("<I", len(body)) + body)
+        sys.stdout.buffer.flush()
+"""
+
+
+@pytest.fixture
+def stub_parser(tmp_path, monkeypatch):
+    """Serve syn parser requests from a stub; returns the modes it was run in"""
+    log = tmp_path / "stub.log"
+    log.touch()
+    stub = tmp_path / "stub-parser"
+    stub.write_text(f"#!{sys.executable}\nLOG = {str(log)!r}\n{STUB_PARSER}")
+    stub.chmod(0o755)
+    monkeypatch.setattr(RustParser, "_binary", str(stub))
+    return lambda: log.read_text().split()
+
+
+@pytest.fixture
+def syn_parser(stub_parser):
+    """A RustParser on the syn backend without disk cache"""
+    parser = RustParser()
+    parser.cache_path = None
+    parser.use_tree_sitter = False
+    yield parser
+    parser.close()
+
+
+def test_daemon_serves_every_parse(syn_parser, stub_parser):
+    """One daemon process handles every parse"""
+
+    async def run():
+        return [
+            await syn_parser.parse_file("a.rs", content)
+            for content in ("a", "b", "broken")
+        ]
+
+    a, b, broken = asyncio.run(run())
+    assert a.metadata["modules"] == ["a"]
+    assert b.metadata["modules"] == ["b"]
+    assert not broken.success
+    assert "expected item" in broken.error
+    assert stub_parser() == ["--daemon"]
+
+
+def test_dead_daemon_falls_back_to_stdin(syn_parser, stub_parser):
+    """A parse the daemon dies on is retried in a one-shot process"""
+
+    async def run():
+        return [
+            await syn_parser.parse_file("a.rs", content) for content in ("crash", "a")
+        ]
+
+    crash, a = asyncio.run(run())
+    assert crash.metadata["modules"] == ["crash"]
+    assert a.metadata["modules"] == ["a"]
+    assert stub_parser() == ["--daemon", "--stdin", "--daemon"]
+
+
+def test_hung_daemon_falls_back_to_stdin(syn_parser, stub_parser):
+    """A daemon that never replies is killed and the parse retried in one shot"""
+    syn_parser.daemon_timeout = 0.5
+
+    async def run():
+        return [
+            await syn_parser.parse_file("a.rs", content) for content in ("hang", "a")
+        ]
+
+    hang, a = asyncio.run(run())
+    assert hang.metadata["modules"] == ["hang"]
+    assert a.metadata["modules"] == ["a"]
+    assert stub_parser() == ["--daemon", "--stdin", "--daemon"]
+
+
+def test_parse_batch_runs_parser_once(syn_parser, stub_parser, tmp_path):
+    """Every uncached file of a batch goes to one --batch run, results in order"""
+    paths = []
+    for content in ("a", "broken", "a", "c"):
+        path = tmp_path / f"{len(paths)}.rs"
+        path.write_text(content)
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.rs"))
+
+    results = asyncio.run(syn_parser.parse_batch(paths))
+
+    assert [r.metadata["modules"] for r in results if r.success] == [
+        ["a"],
+        ["a"],
+        ["c"],
+    ]
+    assert "expected item" in results[1].error
+    assert "Cannot read file" in results[4].error
+    assert stub_parser() == ["--batch"]
+
+
+def test_disk_cache_survives_parser_instances(stub_parser, tmp_path):
+    """A second parser reads the first one's results from the SQLite cache"""
+
+    def parse(content):
+        parser = RustParser()
+        parser.cache_path = tmp_path / "cache.sqlite3"
+        parser.use_tree_sitter = False
+        try:
+            return asyncio.run(parser.parse_file("a.rs", content))
+        finally:
+            parser.close()
+
+    assert parse("a").metadata["modules"] == ["a"]
+    assert parse("a").metadata["modules"] == ["a"]
+    assert stub_parser() == ["--daemon"]
+
+
+def test_disk_cache_versions_and_prunes(tmp_path, monkeypatch):
+    """Entries from another parser version miss, and pruning keeps the newest"""
+    cache_path = tmp_path / "cache.sqlite3"
+    hashes = [f"{i:064x}" for i in range(4)]
+
+    old = RustParser()
+    old.cache_path = cache_path
+    monkeypatch.setattr(rust_parser, "_parser_version", lambda: "old")
+    old._store_cached_ast(hashes[0], {"modules": ["stale"]})
+    old.close()
+
+    monkeypatch.setattr(rust_parser, "_parser_version", lambda: "new")
+    parser = RustParser()
+    parser.cache_path = cache_path
+    parser.max_disk_cache_entries = 2
+    assert parser._load_cached_ast(hashes[0]) is None
+
+    # The first store prunes the stale entry; later ones are kept until next time
+    for content_hash in hashes[1:]:
+        parser._store_cached_ast(content_hash, {"modules": [content_hash]})
+    assert parser._load_cached_ast(hashes[3]) == {"modules": [hashes[3]]}
+    parser.close()
+
+    pruner = RustParser()
+    pruner.cache_path = cache_path
+    pruner.max_disk_cache_entries = 2
+    pruner._store_cached_ast(hashes[0], {"modules": ["fresh"]})
+    # hashes[3] was read last, so hashes[1] and hashes[2] are the oldest
+    with sqlite3.connect(cache_path) as db:
+        kept = {row[0].hex() for row in db.execute("SELECT hash FROM ast_cache")}
+    pruner.close()
+    assert kept == {hashes[0], hashes[3]}
+
+
+def test_tree_sitter_version_mismatch_falls_back_to_syn():
+    """A tree-sitter-rust grammar the installed tree-sitter rejects leaves syn in use"""
+    pytest.importorskip("tree_sitter")
+    script = (
+        "import tree_sitter\n"
+        "def language(*args):\n"
+        "    raise ValueError('Incompatible Language version')\n"
+        "tree_sitter.Language = language\n"
+        "from src.ast.parsers import rust_parser\n"
+        "assert not rust_parser.TREE_SITTER_RUST_AVAILABLE\n"
+        "assert not rust_parser.RustParser().use_tree_sitter\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.fixture
+def missing_crate(tmp_path, monkeypatch):
+    """Point the parser at an install without the crate source or a binary"""
+    monkeypatch.setattr(rust_parser, "_RUST_CRATE_DIR", tmp_path / "missing")
+    monkeypatch.setattr(rust_parser, "_PARSER_INSTALL_ROOT", tmp_path / "root")
+    monkeypatch.setattr(rust_parser.shutil, "which", lambda name: None)
+    monkeypatch.delenv("REACTOR_RUST_AST_PARSER", raising=False)
+    rust_parser._parser_version.cache_clear()
+    yield
+    rust_parser._parser_version.cache_clear()
+
+
+def test_missing_crate_source_disables_build_and_cache(missing_crate, tmp_path):
+    """Without the crate source there is no version, disk cache or build"""
+    parser = RustParser()
+    parser.cache_path = tmp_path / "cache.sqlite3"
+
+    assert rust_parser._parser_version() is None
+    assert parser._get_cache_db() is None
+    with pytest.raises(Exception, match="missing"):
+        RustParser._locate_parser_binary()
+
+
+def test_failed_build_is_not_retried(tmp_path, monkeypatch):
+    """A failed cargo build is remembered instead of re-run for every parse"""
+    builds = []
+
+    def failing_build():
+        builds.append(1)
+        raise Exception("Building the Rust parser failed: cargo not found")
+
+    monkeypatch.setattr(rust_parser, "_PARSER_INSTALL_ROOT", tmp_path / "root")
+    monkeypatch.setattr(rust_parser.shutil, "which", lambda name: None)
+    monkeypatch.delenv("REACTOR_RUST_AST_PARSER", raising=False)
+    monkeypatch.setattr(RustParser, "_install_parser_binary", failing_build)
+    monkeypatch.setattr(RustParser, "_binary", None)
+    monkeypatch.setattr(RustParser, "_binary_error", None)
+    parser = RustParser()
+    parser.cache_path = None
+    parser.use_tree_sitter = False
+
+    for content in ("fn a() {}", "fn b() {}"):
+        result = asyncio.run(parser.parse_file("a.rs", content))
+        assert not result.success
+        assert "cargo not found" in result.error
+    parser.close()
+    assert len(builds) == 1